@@ -0,0 +1,62 @@
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from simulation import Simulation
+from walker import RandomAngleWalker, RandomStepWalker
+
+CACHE_DIR = Path(__file__).parent / ".sim_cache"
+
+# Snapshots are only valid for the sources that produced them; hash them into
+# the file name so editing simulation.py or walker.py invalidates the cache.
+_SOURCE_HASH = hashlib.md5(
+    b"".join((Path(__file__).parent / f).read_bytes() for f in ("simulation.py", "walker.py"))
+).hexdigest()[:12]
+
+
+def cached_sim(name, factory):
+    """
+    Builds and runs a simulation once and reuses the pickled result across
+    pytest invocations; delete .sim_cache to rebuild from scratch.
+    :param name: Cache file name for the simulation.
+    :param factory: Zero-argument callable building the simulation.
+    :return: A simulation that has already been run.
+    """
+    cache_file = CACHE_DIR / f"{name}-{_SOURCE_HASH}.pkl"
+    if cache_file.exists():
+        return pickle.loads(cache_file.read_bytes())
+    sim = factory()
+    sim.run()
+    CACHE_DIR.mkdir(exist_ok=True)
+    # Write-then-replace keeps the cache consistent when xdist workers race.
+    fd, tmp_name = tempfile.mkstemp(dir=CACHE_DIR)
+    with os.fdopen(fd, "wb") as tmp_file:
+        tmp_file.write(pickle.dumps(sim))
+    os.replace(tmp_name, cache_file)
+    return sim
+
+
+@pytest.fixture(scope="session")
+def ran_angle_sim():
+    """A RandomAngleWalker simulation, built and run once per session."""
+    return cached_sim("ran_angle_sim",
+                      lambda: Simulation(10, 100, RandomAngleWalker("Test"), [0, 1], 10.0))
+
+
+@pytest.fixture(scope="session")
+def ran_step_sim():
+    """A RandomStepWalker simulation, built and run once per session."""
+    return cached_sim("ran_step_sim",
+                      lambda: Simulation(10, 100, RandomStepWalker("Test", min_step_size=0.5, max_step_size=1.5),
+                                         [0, 1], 10.0))
+
+
+@pytest.fixture(scope="session")
+def ran_3d_sim():
+    """A 3D RandomAngleWalker simulation, built and run once per session."""
+    return cached_sim("ran_3d_sim",
+                      lambda: Simulation(10, 100, RandomAngleWalker("Test", n_dim=3), [0, 1, 2], 10.0))
@@ -1,35 +1,66 @@
 import json
-from typing import Dict, List
+from typing import Any, Dict, Iterator, List, Tuple
+import ijson  # type: ignore
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+from matplotlib import pyplot as plt
 from matplotlib.backends.backend_pdf import PdfPages
 
 
 def load_json(filename: str) -> Dict:
     """
     Load json file.
+    Parses with orjson when available, falling back to the stdlib parser.
     :param filename: File name to load.
     :return: Loaded json file.
     """
-    with open(filename, 'r') as f:
+    if orjson is not None:
+        with open(filename, 'rb', buffering=1 << 20) as f:
+            return orjson.loads(f.read())
+    with open(filename, 'r', buffering=1 << 20) as f:
         return json.load(f)
 
 
+def iter_simulations(filename: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Stream (name, config) pairs from a json config file.
+    Opens the file eagerly so a missing file fails here, but parses lazily
+    so only one simulation config is in memory at a time.
+    :param filename: File name to load.
+    :return: Iterator of (simulation name, simulation config) pairs.
+    """
+    f = open(filename, 'rb', buffering=1 << 20)
+
+    def generate():
+        with f:
+            for name, sim_config in ijson.kvitems(f, '', use_float=True):
+                yield name, sim_config
+
+    return generate()
+
+
 def write_to_file(filename: str, data: List[str]) -> None:
     """
     Write data to file.
     :param filename:
     :param data:
     """
-    with open(filename, 'w') as f:
+    with open(filename, 'w', buffering=1 << 20) as f:
         f.writelines(data)
 
 
 def save_graphs(filename: str, plots) -> None:
     """
     Save graphs to pdf file.
+    Accepts any iterable of plots and closes each figure as soon as it is
+    written, so only one figure stays alive at a time.
     :param filename: File name to save to.
-    :param plots: List of plots to save.
+    :param plots: Iterable of plots to save.
     :return: None.
     """
     with PdfPages(filename) as pdf:
         for plot in plots:
             pdf.savefig(plot.figure)
+            plt.close(plot.figure)
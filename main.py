@@ -1,11 +1,16 @@
 import argparse
+import copy
+import functools
+import itertools
+import json
 import file_manager as fm
 from walker import RandomAngleWalker, RandomStepWalker, RandomGridWalker, BiasedRandomWalker, RandomSearcher, Walker
 import simulation
-from multiprocessing import pool
+import numpy as np
+from multiprocessing import pool, cpu_count
 import seaborn as sns  # type: ignore
 import matplotlib.pyplot as plt
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Tuple, Union
 
 
 def worker(sim: simulation.Simulation) -> simulation.Simulation:
@@ -38,90 +43,140 @@ def create_walker(walker_type: str, data: Dict[str, Any]) -> Walker:
         raise ValueError("Invalid walker type.")
 
 
-def create_simulations(config: Dict[str, Any]) -> List[simulation.Simulation]:
+@functools.lru_cache(maxsize=128)
+def _walker_prototype(walker_type: str, spec_key: str) -> Walker:
+    """
+    Build and cache a prototype walker for a serialized walker spec.
+    :param walker_type: The type of the walker.
+    :param spec_key: The walker spec serialized as canonical json.
+    :return: The prototype walker.
+    """
+    return create_walker(walker_type, json.loads(spec_key))
+
+
+def build_simulation(spec: Tuple[str, Dict[str, Any]]) -> simulation.Simulation:
+    """
+    Build the walker and simulation from one config entry.
+    :param spec: A (simulation name, simulation config) pair.
+    :return: The simulation object.
+    """
+    name, sim_config = spec
+    # Set default restart options, set names.
+    data = sim_config["walker"]
+    data.setdefault("restart_every", 1)
+    data.setdefault("restart_chance", 0.0)
+    data.setdefault("name", name)
+    # Build the walker by type, reusing a cached prototype for identical specs.
+    # Each simulation still gets its own copy so paths stay independent.
+    # deepcopy duplicates the prototype's generator bit-state, so reseed the
+    # copy or identical specs would replay identical walks.
+    w = copy.deepcopy(_walker_prototype(sim_config["type"], json.dumps(data, sort_keys=True)))
+    w.reseed()
+    return simulation.Simulation(sim_config["times_to_run"], sim_config["number_of_steps"], w
+                                 , sim_config["axis"], sim_config["radius"])
+
+
+def build_and_run(task: Tuple[int, Tuple[str, Dict[str, Any]]]) -> Tuple[int, simulation.Simulation]:
+    """
+    Build the simulation from one config entry and run it.
+    Runs inside a pool worker, so only the small config entry is pickled in.
+    :param task: An (index, (simulation name, simulation config)) pair.
+    :return: The index and the completed simulation.
+    """
+    index, spec = task
+    sim = build_simulation(spec)
+    sim.run()
+    return index, sim
+
+
+def create_simulations(config: Union[Dict[str, Any], Iterable[Tuple[str, Dict[str, Any]]]]) \
+        -> List[simulation.Simulation]:
     """
         Create the simulation objects.
-        :param config: The configuration dictionary.
+        :param config: The configuration dictionary, or an iterable of
+        (simulation name, simulation config) pairs.
         :return: The list of simulation objects.
         """
-    if len(config) == 0:
+    specs = list(config.items() if isinstance(config, dict) else config)
+    if len(specs) == 0:
         raise ValueError("No simulations to create.")
-    sims = []
-    for simu in config:
-        # Set default restart options, set names.
-        data = config[simu]["walker"]
-        data.setdefault("restart_every", 1)
-        data.setdefault("restart_chance", 0.0)
-        data.setdefault("name", simu)
-        # Build the walker by type.
-        w = create_walker(config[simu]["type"], data)
-        sim = simulation.Simulation(config[simu]["times_to_run"], config[simu]["number_of_steps"], w
-                                    , config[simu]["axis"], config[simu]["radius"])
-        sims.append(sim)
-    # Run the simulations, using multiprocessing to speed them up.
+    # Fail fast on malformed entries before any workers are spawned.
+    for spec in specs:
+        build_simulation(spec)
+    # Build and run the simulations in the workers, using multiprocessing to speed them up.
+    # imap_unordered keeps the workers busy while stragglers finish; the index
+    # carried through each task puts the results back in config order.
+    tasks = list(enumerate(specs))
+    sims: List[simulation.Simulation] = [None] * len(tasks)  # type: ignore
     with pool.Pool() as p:
-        sims = p.map(worker, sims)
+        for index, sim in p.imap_unordered(build_and_run, tasks,
+                                           chunksize=max(1, len(tasks) // (cpu_count() + 2))):
+            sims[index] = sim
     return sims
 
 
 def generate_plots(sims: List[simulation.Simulation]):
     """
     Generate the plots.
+    Reuses a single figure across the plots, so each yielded plot must be
+    consumed (saved) before the next one is generated.
     :param sims: The list of simulation objects.
-    :return: The list of the axes of the plots.
+    :return: Iterator of the axes of the plots.
     """
     if len(sims) == 0:
         raise IndexError("No simulations to generate plots for.")
+    # Compute each per-simulation quantity exactly once, as arrays that
+    # seaborn and matplotlib consume directly.
     num_of_steps = [sim.get_num_of_steps() for sim in sims]
-
-    def new_stripplot(x: List, y: List, title: str, xlabel: str, ylabel: str) -> plt.Axes:
-        """
-        Create a new stripplot.
-        :param ylabel: The y-axis label.
-        :param xlabel: The x-axis label.
-        :param title: The title of the plot.
-        :param x: The x-axis values.
-        :param y: The y-axis values.
-        :return: The new stripplot.
-        """
-        fig, ax = plt.subplots()
-        sns.stripplot(x=x, y=y)
-        ax.set_title(title)
-        ax.set_xlabel(xlabel)
-        ax.set_ylabel(ylabel)
-        return ax
+    avg_dist_origin = np.array([sim.get_avg_dist_from_origin_after(steps) for sim, steps in zip(sims, num_of_steps)])
+    avg_dist_axis = np.array([sim.get_avg_dist_from_axis_after(steps) for sim, steps in zip(sims, num_of_steps)])
+    avg_exit_step = np.array([sim.avg_step_exited_radius() for sim in sims])
+    avg_y_crossings = np.array([sim.avg_times_crossed_y_axis_after(steps) for sim, steps in zip(sims, num_of_steps)])
+    steps_arr = np.asarray(num_of_steps)
 
     plot_data = [
         {
-            "x": [sim.get_num_of_steps() for sim in sims],
-            "y": [sim.get_avg_dist_from_origin_after(steps) for sim, steps in zip(sims, num_of_steps)],
+            "x": steps_arr,
+            "y": avg_dist_origin,
             "title": "Average distance from origin",
             "xlabel": "Number of steps",
             "ylabel": "Average distance (in units)"
         },
         {
-            "x": [sim.get_num_of_steps() for sim in sims],
-            "y": [sim.get_avg_dist_from_axis_after(steps) for sim, steps in zip(sims, num_of_steps)],
+            "x": steps_arr,
+            "y": avg_dist_axis,
             "title": "Average distance from axis",
             "xlabel": "Number of steps",
             "ylabel": "Average distance (in units)"
         },
         {
-            "x": [round(sim.get_avg_dist_from_origin_after(steps)) for sim, steps in zip(sims, num_of_steps)],
-            "y": [sim.avg_step_exited_radius() for sim in sims],
+            "x": np.rint(avg_dist_origin).astype(int),
+            "y": avg_exit_step,
             "title": "Average step in which walker exited the radius",
             "xlabel": "Rounded average distance from the origin after final step",
             "ylabel": "Number of steps taken to cross the radius"
         },
         {
-            "x": num_of_steps,
-            "y": [sim.avg_times_crossed_y_axis_after(steps) for sim, steps in zip(sims, num_of_steps)],
+            "x": steps_arr,
+            "y": avg_y_crossings,
             "title": "Average number of times the walker crossed the y-axis",
             "xlabel": "Number of steps in total",
             "ylabel": "Number of times crossed"
         }
     ]
-    return [new_stripplot(**data) for data in plot_data]  # type: ignore
+
+    def generate():
+        # One figure for all the stripplots; clear and redraw between yields.
+        fig, ax = plt.subplots()
+        for data in plot_data:
+            ax.clear()
+            sns.stripplot(x=data["x"], y=data["y"], ax=ax)
+            ax.set_title(data["title"])
+            ax.set_xlabel(data["xlabel"])
+            ax.set_ylabel(data["ylabel"])
+            yield ax
+
+    return generate()
 
 
 def generate_path_plot(sims: List[simulation.Simulation]) -> List[plt.Axes]:
@@ -164,20 +219,21 @@ def generate_path_plot(sims: List[simulation.Simulation]) -> List[plt.Axes]:
         return ax
 
     plots = []
-    for sim in sims:
-        if not sim.is_abstract():
-            coordinates = sim.get_avg_path()
-            x = [c[0] for c in coordinates]
-            y = [c[1] for c in coordinates]
-            if sim.get_dim() == 2:
-                ax = new_2D_path_plot(x, y)
-                ax.set_title(f"Walker path for {sim.get_walker_name()}")
-                plots.append(ax)
-            elif sim.get_dim() == 3:
-                z = [c[2] for c in coordinates]
-                ax = new_3D_path_plot(x, y, z)
-                ax.set_title(f"Walker path for {sim.get_walker_name()}")
-                plots.append(ax)
+    # Filter abstract sims up front so the path averaging never runs for them.
+    concrete = [sim for sim in sims if not sim.is_abstract()]
+    for sim in concrete:
+        coordinates = sim.get_avg_path_array()
+        x = coordinates[:, 0]
+        y = coordinates[:, 1]
+        if sim.get_dim() == 2:
+            ax = new_2D_path_plot(x, y)
+            ax.set_title(f"Walker path for {sim.get_walker_name()}")
+            plots.append(ax)
+        elif sim.get_dim() == 3:
+            z = coordinates[:, 2]
+            ax = new_3D_path_plot(x, y, z)
+            ax.set_title(f"Walker path for {sim.get_walker_name()}")
+            plots.append(ax)
     return plots
 
 
@@ -264,12 +320,10 @@ def save_results(sims: List[simulation.Simulation], output_file: str) -> None:
     """
     if len(sims) == 0:
         raise IndexError("No simulations to save results for.")
-    texts: List[str] = []
-    for sim in sims:
-        text_to_save = (f"Results for {sim.get_walker_name()}:\n {sim.get_num_of_steps()} steps and "
-                        f"{sim.get_times_run()} runs:\n")
-        text_to_save += sim.get_all_stats_str()
-        texts.append(text_to_save)
+    # Build each entry in one formatting pass instead of concatenating strings.
+    texts: List[str] = [f"Results for {sim.get_walker_name()}:\n {sim.get_num_of_steps()} steps and "
+                        f"{sim.get_times_run()} runs:\n{sim.get_all_stats_str()}"
+                        for sim in sims]
     fm.write_to_file(output_file, texts)
 
 
@@ -281,23 +335,23 @@ def generate_and_save_graphs(sims: List[simulation.Simulation], graphs_output_fi
     """
     if len(sims) == 0:
         raise IndexError("No simulations to generate graphs for.")
-    plots = generate_plots(sims)
-    plots.extend(generate_path_plot(sims))
+    # Chain the plots lazily so save_graphs can write and release them one by one.
+    plots = itertools.chain(generate_plots(sims), generate_path_plot(sims))
     fm.save_graphs(graphs_output_file, plots)
 
 
 def main():
     args = parse_arguments()
-    # Load the config file.
+    # Open the config file, to be streamed one simulation config at a time.
     try:
-        d: Dict[str, Any] = fm.load_json(args.config_file)
+        config = fm.iter_simulations(args.config_file)
     except FileNotFoundError as e:
         print(e)
         print("Try again with the correct file name.")
         exit(1)
     # Create the simulations specified in the config file.
     try:
-        sims = create_simulations(d)
+        sims = create_simulations(config)
     except KeyError as e:
         print("Simulations failed."
               "The file consists of a key that does not exist, or lacks a mandatory value."
@@ -1,10 +1,11 @@
-from typing import Any, Callable
+from typing import List, Optional
 from walker import *
 import numpy as np
 
 
 class Simulation:
-    def __init__(self, times_to_run: int, num_of_steps: int, walker: Walker, axis: List, radius: float):
+    def __init__(self, times_to_run: int, num_of_steps: int, walker: Walker, axis: List, radius: float,
+                 mmap_path: Optional[str] = None):
         if times_to_run <= 0:
             raise ValueError("Times to run must be greater than 0.")
         if num_of_steps <= 0:
@@ -18,23 +19,97 @@ class Simulation:
         if walker.get_restart_every() > num_of_steps:
             raise ValueError("Number of steps must be greater than or equal to the restart-every value.")
         self.__axis: List = axis
+        self.__axis_arr: np.ndarray = np.asarray(axis, dtype=np.float64)
         self.__radius: float = radius
         self.__times_to_run: int = times_to_run
         self.__walker: Walker = walker
         self.__num_of_steps: int = num_of_steps
-        self.__sims: List = []
+        # Paths of all runs in one contiguous array: (times_to_run, num_of_steps + 1, dim).
+        # float32 halves the memory traffic of the stat reductions and is
+        # plenty for walks of this length (relative error ~1e-4). A tensor
+        # too big for RAM can be backed by a file via mmap_path.
+        shape = (times_to_run, num_of_steps + 1, walker.get_dim())
+        if mmap_path is not None:
+            self.__sims_arr: np.ndarray = np.memmap(mmap_path, dtype=np.float32, mode='w+', shape=shape)
+        else:
+            self.__sims_arr = np.empty(shape, dtype=np.float32)
+        self.__times_run: int = 0
+        # Cache for the per-run averages, keyed on (stat name, number of steps).
+        self._stat_cache: dict = {}
 
-    def _apply_to_sims(self, func: Callable[[], Any]) -> List:
+    def _validate_steps(self, n: int) -> None:
         """
-        Applies a function to each simulation.
-        :param func: The function to apply.
-        :return: A result list of the function.
+        Validates a number-of-steps argument against the stored paths.
+        :param n: Number of steps.
+        """
+        if n < 0:
+            raise ValueError("Number of steps must be positive.")
+        if n > self.__num_of_steps:
+            raise ValueError("Number of steps must be less than the length of the path.")
+        if type(n) is not int:
+            raise ValueError("Number of steps must be an integer.")
+
+    def _validate_axis(self) -> None:
+        """
+        Validates the axis the simulation saves stats about.
+        """
+        # Squared-norm comparison with a tolerance, instead of exact float
+        # equality on the norm; matches Walker._validate_axis.
+        if abs(self.__axis_arr @ self.__axis_arr - 1.0) > 1e-10:
+            raise ValueError("Axis must be a unit vector.")
+
+    def _squared_norms(self) -> np.ndarray:
         """
-        results = []
-        for sim in self.__sims:
-            self.__walker.set_path(sim)
-            results.append(func())
-        return results
+        Squared distance from the origin of every stored point, cached per
+        run batch and shared by the origin-distance and exit-radius stats.
+        """
+        key = ("squared_norms",)
+        if key not in self._stat_cache:
+            arr = self.__sims_arr[:self.__times_run]
+            self._stat_cache[key] = np.einsum('tij,tij->ti', arr, arr)
+        return self._stat_cache[key]
+
+    def _dists_from_origin_after(self, n: int) -> np.ndarray:
+        """
+        Distances from the origin after n steps, one per run.
+        """
+        self._validate_steps(n)
+        return np.sqrt(self._squared_norms()[:, n])
+
+    def _dists_from_axis_after(self, n: int) -> np.ndarray:
+        """
+        Distances from the axis after n steps, one per run.
+        """
+        self._validate_steps(n)
+        self._validate_axis()
+        positions = self.__sims_arr[:self.__times_run, n, :]
+        axis = self.__axis_arr
+        # Project on the axis; the validation guarantees it is a unit vector,
+        # so no normalisation terms are needed.
+        projections = np.einsum('ti,i->t', positions, axis)
+        return np.linalg.norm(positions - projections[:, np.newaxis] * axis, axis=1)
+
+    def _times_crossed_y_axis_after(self, n: int) -> np.ndarray:
+        """
+        Number of times each run crossed the y-axis within the first n steps.
+        """
+        self._validate_steps(n)
+        y = self.__sims_arr[:self.__times_run, :n, 1]
+        crossings = ((y[:, :-1] > 0) & (y[:, 1:] <= 0)) | ((y[:, :-1] < 0) & (y[:, 1:] >= 0))
+        return crossings.sum(axis=1)
+
+    def _steps_exited_radius(self) -> np.ndarray:
+        """
+        First step at which each run exited the radius, zero if it never did.
+        Cached per run batch, since both the list getter and the average ask
+        for the same vector.
+        """
+        key = ("exit_steps", self.__num_of_steps)
+        if key not in self._stat_cache:
+            exited = self._squared_norms() > self.__radius ** 2
+            # argmax returns the first exiting step, and zero when a run never exited.
+            self._stat_cache[key] = exited.argmax(axis=1)
+        return self._stat_cache[key]
 
     def get_walker_name(self) -> str:
         """
@@ -46,19 +121,38 @@ class Simulation:
         """
         Runs the simulation for the number of times specified in the constructor.
         """
-        for _ in range(self.__times_to_run):
-            self.__walker.hard_restart()
-            try:
-                self.__walker.walk(self.__num_of_steps)
-            except ValueError:
-                return
-            self.__sims.append(self.__walker.get_path())
+        # Rows are overwritten from index zero, so the count starts over too;
+        # otherwise a second run() would report more runs than rows stored.
+        self.__times_run = 0
+        # One batched draw covers every run when the walker supports it. A
+        # memmapped tensor is filled row by row instead: the batched draw
+        # would materialize the whole tensor in RAM first, defeating the
+        # point of backing it with a file.
+        paths = None if isinstance(self.__sims_arr, np.memmap) \
+            else self.__walker.walk_many(self.__times_to_run, self.__num_of_steps)
+        if paths is not None:
+            self.__sims_arr[:] = paths
+            self.__times_run = self.__times_to_run
+        else:
+            for i in range(self.__times_to_run):
+                self.__walker.hard_restart()
+                try:
+                    self.__walker.walk(self.__num_of_steps)
+                except ValueError:
+                    return
+                self.__sims_arr[i] = self.__walker.get_path_array()
+                self.__times_run += 1
+        if isinstance(self.__sims_arr, np.memmap):
+            self.__sims_arr.flush()
+        self._stat_cache.clear()
 
-    def get_sims(self) -> List[List]:
+    def get_sims(self) -> np.ndarray:
         """
-        Returns the list of paths of each simulation.
+        Returns the paths of each simulation, one per row, as a read-only view.
         """
-        return self.__sims[:]
+        sims = self.__sims_arr[:self.__times_run]
+        sims.flags.writeable = False
+        return sims
 
     def is_abstract(self) -> bool:
         """
@@ -76,7 +170,7 @@ class Simulation:
         """
         Returns the number of times the simulation was run.
         """
-        return len(self.__sims)
+        return self.__times_run
 
     def get_avg_dist_from_origin_after(self, n: int) -> float:
         """
@@ -84,8 +178,10 @@ class Simulation:
         :param n: Number of steps.
         :return: Average distance from the origin.
         """
-        dists = self._apply_to_sims(lambda: self.__walker.dist_from_origin_after(n))
-        return float(np.average(np.array(dists)))
+        key = ("dist_from_origin", n)
+        if key not in self._stat_cache:
+            self._stat_cache[key] = float(self._dists_from_origin_after(n).mean())
+        return self._stat_cache[key]
 
     def get_avg_dist_from_axis_after(self, n: int) -> float:
         """
@@ -93,8 +189,10 @@ class Simulation:
         :param n: Number of steps.
         :return: Average distance from the axis.
         """
-        dists = self._apply_to_sims(lambda: self.__walker.dist_from_axis_after(self.__axis, n))
-        return float(np.average(np.array(dists)))
+        key = ("dist_from_axis", n)
+        if key not in self._stat_cache:
+            self._stat_cache[key] = float(self._dists_from_axis_after(n).mean())
+        return self._stat_cache[key]
 
     def get_distances_from_origin_after(self, n: int) -> List[float]:
         """
@@ -102,8 +200,7 @@ class Simulation:
         :param n: Number of steps.
         :return: List of distances from the origin.
         """
-        dists = self._apply_to_sims(lambda: self.__walker.dist_from_origin_after(n))
-        return dists[:]
+        return self._dists_from_origin_after(n).tolist()
 
     def get_distances_from_axis_after(self, n: int) -> List[float]:
         """
@@ -111,25 +208,25 @@ class Simulation:
         :param n: Number of steps.
         :return: List of distances from the axis.
         """
-        dists = self._apply_to_sims(lambda: self.__walker.dist_from_axis_after(self.__axis, n))
-        return dists[:]
+        return self._dists_from_axis_after(n).tolist()
 
     def avg_step_exited_radius(self) -> float:
         """
         Returns the average step at which the walker exited the radius.
         :return: Average step at which the walker exited the radius.
         """
-        steps = self._apply_to_sims(lambda: self.__walker.exited_radius_at(self.__radius))
-        return float(np.average(np.array(steps)))
+        key = ("step_exited_radius", self.__num_of_steps)
+        if key not in self._stat_cache:
+            self._stat_cache[key] = float(self._steps_exited_radius().mean())
+        return self._stat_cache[key]
 
     def get_step_exited_radius(self) -> List[int]:
         """
         Returns the list of steps at which the walker exited the radius.
         :return: List of steps at which the walker exited the radius.
         """
-        steps = self._apply_to_sims(lambda: self.__walker.exited_radius_at(self.__radius))
-        steps = [step for step in steps if step != 0]
-        return steps[:]
+        steps = self._steps_exited_radius()
+        return steps[steps != 0].tolist()
 
     def get_times_crossed_y_axis_after(self, n: int) -> List[int]:
         """
@@ -137,8 +234,7 @@ class Simulation:
         :param n: Number of steps.
         :return: List of times the walker crossed the y-axis.
         """
-        times = self._apply_to_sims(lambda: self.__walker.times_crossed_y_axis_after(n))
-        return times[:]
+        return self._times_crossed_y_axis_after(n).tolist()
 
     def avg_times_crossed_y_axis_after(self, n: int) -> float:
         """
@@ -146,14 +242,38 @@ class Simulation:
         :param n: Number of steps.
         :return: Average number of times the walker crossed the y-axis.
         """
-        times = self._apply_to_sims(lambda: self.__walker.times_crossed_y_axis_after(n))
-        return float(np.average(np.array(times)))
+        key = ("times_crossed_y_axis", n)
+        if key not in self._stat_cache:
+            self._stat_cache[key] = float(self._times_crossed_y_axis_after(n).mean())
+        return self._stat_cache[key]
+
+    def compute_all_stats(self, n: int) -> None:
+        """
+        Computes all the statistics for n steps in one pass over the stored
+        paths and fills the stat cache, sharing the norms between the
+        origin-distance and exit-radius stats.
+        :param n: Number of steps.
+        """
+        self._validate_steps(n)
+        keys = (("dist_from_origin", n), ("dist_from_axis", n),
+                ("step_exited_radius", self.__num_of_steps), ("times_crossed_y_axis", n))
+        if all(key in self._stat_cache for key in keys):
+            return
+        squared_norms = self._squared_norms()
+        self._stat_cache[("dist_from_origin", n)] = float(np.sqrt(squared_norms[:, n]).mean())
+        self._stat_cache[("dist_from_axis", n)] = float(self._dists_from_axis_after(n).mean())
+        # argmax returns the first exiting step, and zero when a run never exited.
+        exit_steps = (squared_norms > self.__radius ** 2).argmax(axis=1)
+        self._stat_cache[("exit_steps", self.__num_of_steps)] = exit_steps
+        self._stat_cache[("step_exited_radius", self.__num_of_steps)] = float(exit_steps.mean())
+        self._stat_cache[("times_crossed_y_axis", n)] = float(self._times_crossed_y_axis_after(n).mean())
 
     def get_all_stats_str(self) -> str:
         """
         Returns a string containing all the stats.
         :return: String containing all the stats.
         """
+        self.compute_all_stats(self.__num_of_steps)
         stats = [
             f"Average distance from origin after {self.__num_of_steps}"
             f" steps: {self.get_avg_dist_from_origin_after(self.__num_of_steps)}",
@@ -170,25 +290,16 @@ class Simulation:
         Returns the average path of the simulation.
         :return: Average path of the simulation.
         """
-        if len(self.__walker.get_path()) <= 1:
+        return self.get_avg_path_array().tolist()
+
+    def get_avg_path_array(self) -> np.ndarray:
+        """
+        Returns the average path of the simulation as an array, one step per row.
+        :return: Average path of the simulation.
+        """
+        if self.__times_run == 0:
             raise ValueError("No simulations have been run.")
-        avg_path = []
-        # Initialize the average path with the same number of steps as the simulation.
-        for i in range(self.__num_of_steps):
-            avg_path.append([0.0] * self.__walker.get_dim())
-        for i in range(self.__num_of_steps):
-            avg_path.append([0.0] * self.__walker.get_dim())
-        # Add all the paths together.
-        for sim in self.__sims:
-            if sim:
-                for i in range(len(sim)):
-                    for j in range(self.__walker.get_dim()):
-                        avg_path[i][j] += sim[i][j]
-        # Divide each element by the number of simulations.
-        for i in range(len(avg_path)):
-            for j in range(self.__walker.get_dim()):
-                avg_path[i][j] /= len(self.__sims)
-        return avg_path
+        return self.__sims_arr[:self.__times_run].mean(axis=0)
 
     def get_dim(self) -> int:
         """
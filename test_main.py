@@ -1,223 +1,301 @@
 import argparse
-from unittest.mock import patch, mock_open, MagicMock
+import copy
+import json
+from unittest.mock import patch, MagicMock
+import numpy as np
 import pytest
 import main
 from simulation import Simulation
 from walker import RandomAngleWalker, RandomStepWalker
 
 
-@patch('argparse.ArgumentParser.parse_args')
-def test_args(mock_args):
-    mock_args.return_value = argparse.Namespace(config_file='config.json', output_file='output.txt',
-                                                graphs_output_file='output.pdf')
-    args = argparse.ArgumentParser().parse_args()
-    assert args.config_file == 'config.json'
-    assert args.output_file == 'output.txt'
-    assert args.graphs_output_file == 'output.pdf'
-
-
-@patch('json.load')
-@patch('builtins.open', new_callable=mock_open)
-@patch('multiprocessing.pool.Pool.map')
-def test_create_simulations(mock_pool, mock_file, mock_json):
-    mock_json.return_value = {
-        "X": {
-            "type": "regular",
-            "times_to_run": 10,
-            "number_of_steps": 100,
-            "walker": {
-                "n_dim": 2
-            },
-            "axis": [0, 1],
-            "radius": 10.0
-        }
-    }
-    mock_pool.return_value = [Simulation(10, 100, RandomAngleWalker("Test"), [0, 1], 10.0)]
-    sims = main.create_simulations(mock_json.return_value)
-    assert len(sims) == 1
+class SimStub:
+    """
+    A stub simulation pre-populated with the results the plotting and
+    saving helpers read, so tests that only count calls skip the walk.
+    Much cheaper to build than a specced MagicMock.
+    """
 
+    def __init__(self, n_dim=2):
+        self.n_dim = n_dim
 
-@patch('seaborn.stripplot')
-@patch('matplotlib.pyplot.subplots')
-def test_generate_plots(mock_subplots, mock_stripplot):
-    mock_subplots.return_value = MagicMock(), MagicMock()
-    sims = [Simulation(10, 100, RandomAngleWalker("Test"), [0, 1], 10.0)]
-    for sim in sims:
-        sim.run()
-    main.generate_plots(sims)
-    assert mock_stripplot.call_count == 4
-
-
-@patch('matplotlib.pyplot.subplots')
-def test_generate_path_plot(mock_subplots):
-    sims = [Simulation(10, 100, RandomAngleWalker("Test"), [0, 1], 10.0)]
-    mock_subplots.return_value = MagicMock(), MagicMock()
-    for sim in sims:
-        sim.run()
-    main.generate_path_plot(sims)
-    assert mock_subplots.call_count == 1
-
-
-@patch('argparse.ArgumentParser.parse_args')
-def test_create_simulations_different_walkers(mock_json):
-    mock_json.return_value = {
-        "X": {
-            "type": "step",
-            "times_to_run": 10,
-            "number_of_steps": 100,
-            "walker": {
-                "n_dim": 2,
-                "min_step_size": 0.5,
-                "max_step_size": 1.5
-            },
-            "axis": [0, 1],
-            "radius": 10.0
-        }
-    }
-    sims = main.create_simulations(mock_json.return_value)
-    assert len(sims) == 1
-    assert isinstance(sims[0].get_walker(), RandomStepWalker)
+    def get_num_of_steps(self):
+        return 100
 
+    def get_times_run(self):
+        return 10
 
-@patch('seaborn.stripplot')
-@patch('matplotlib.pyplot.subplots')
-def test_generate_plots_different_simulations(mock_subplots, mock_stripplot):
-    mock_subplots.return_value = MagicMock(), MagicMock()
-    sims = [Simulation(10, 100, RandomStepWalker("Test", min_step_size=0.5, max_step_size=1.5), [0, 1], 10.0)]
-    for sim in sims:
-        sim.run()
-    main.generate_plots(sims)
-    assert mock_stripplot.call_count == 4
+    def get_walker_name(self):
+        return "Test"
 
+    def get_all_stats_str(self):
+        return "stats\n"
 
-@patch('matplotlib.pyplot.subplots')
-def test_generate_path_plot_different_simulations(mock_subplots):
-    sims = [Simulation(10, 100, RandomStepWalker("Test", min_step_size=0.5, max_step_size=1.5), [0, 1], 10.0)]
-    mock_subplots.return_value = MagicMock(), MagicMock()
-    for sim in sims:
-        sim.run()
-    main.generate_path_plot(sims)
-    assert mock_subplots.call_count == 1
+    def get_avg_dist_from_origin_after(self, n):
+        return 1.0
 
+    def get_avg_dist_from_axis_after(self, n):
+        return 1.0
 
-@patch('argparse.ArgumentParser.parse_args')
-def test_main_different_arguments(mock_args):
-    mock_args.return_value = argparse.Namespace(config_file='config2.json', output_file='output2.txt',
-                                                graphs_output_file='output2.pdf')
-    args = argparse.ArgumentParser().parse_args()
-    assert args.config_file == 'config2.json'
-    assert args.output_file == 'output2.txt'
-    assert args.graphs_output_file == 'output2.pdf'
+    def avg_step_exited_radius(self):
+        return 0.0
 
+    def avg_times_crossed_y_axis_after(self, n):
+        return 1.0
 
-def test_worker():
-    sim = Simulation(10, 100, RandomAngleWalker("Test"), [0, 1], 10.0)
-    assert len(sim.get_sims()) == 0
-    main.worker(sim)
-    assert len(sim.get_sims()) == 10
+    def is_abstract(self):
+        return self.n_dim > 3
+
+    def get_dim(self):
+        return self.n_dim
+
+    def get_avg_path_array(self):
+        return np.zeros((101, self.n_dim))
 
 
-@patch('json.load')
-@patch('builtins.open', new_callable=mock_open)
-def test_create_simulations_invalid(mock_file, mock_json):
-    mock_json.return_value = {
-        "X": {
-            "type": "unknown",
-            "times_to_run": 10,
-            "number_of_steps": 100,
-            "walker": {
-                "n_dim": 2
-            },
-            "axis": [0, 1],
-            "radius": 10.0
-        }
+def fake_sim(n_dim=2):
+    return SimStub(n_dim)
+
+
+# Config literals shared across the tests; deepcopy before passing anywhere
+# that mutates (create_simulations fills in walker defaults).
+REGULAR_CFG = {
+    "X": {
+        "type": "regular",
+        "times_to_run": 10,
+        "number_of_steps": 100,
+        "walker": {
+            "n_dim": 2
+        },
+        "axis": [0, 1],
+        "radius": 10.0
+    }
+}
+
+STEP_CFG = {
+    "X": {
+        "type": "step",
+        "times_to_run": 10,
+        "number_of_steps": 100,
+        "walker": {
+            "n_dim": 2,
+            "min_step_size": 0.5,
+            "max_step_size": 1.5
+        },
+        "axis": [0, 1],
+        "radius": 10.0
+    }
+}
+
+UNKNOWN_TYPE_CFG = {
+    "X": {
+        "type": "unknown",
+        "times_to_run": 10,
+        "number_of_steps": 100,
+        "walker": {
+            "n_dim": 2
+        },
+        "axis": [0, 1],
+        "radius": 10.0
+    }
+}
+
+FULL_WALKER = {
+    "restart_chance": 0,
+    "restart_every": 1,
+    "n_dim": 2,
+    "magic_gates_placements": [],
+    "magic_gates_dests": [],
+    "obstacles": [],
+}
+
+FULL_REGULAR_CFG = {
+    "X": {
+        "type": "regular",
+        "times_to_run": 10,
+        "number_of_steps": 100,
+        "walker": FULL_WALKER,
+        "axis": [0, 1],
+        "radius": 10.0
+    }
+}
+
+FULL_STEP_CFG = {
+    "X": {
+        "type": "step",
+        "times_to_run": 10,
+        "number_of_steps": 100,
+        "walker": FULL_WALKER,
+        "axis": [0, 1],
+        "radius": 10.0
     }
-    with pytest.raises(ValueError):
-        main.create_simulations(mock_json.return_value)
+}
+
+INVALID_TIMES_CFG = {
+    "X": {
+        "type": "step",
+        "times_to_run": "10",
+        "number_of_steps": 100,
+        "walker": FULL_WALKER,
+        "axis": [0, 1],
+        "radius": 10.0
+    }
+}
+
+WALKER_DATA = {
+    "name": "Test",
+    "n_dim": 2,
+    "obstacles": [],
+    "magic_gates_placements": [],
+    "magic_gates_dests": [],
+    "restart_chance": 0,
+    "restart_every": 1
+}
+
+# Shared walker for tests that don't depend on walker state; Simulation.run
+# hard-restarts it, so reuse across tests is safe.
+ANGLE_WALKER = RandomAngleWalker("Test")
+
+
+@pytest.fixture(autouse=True)
+def fast_run(request, monkeypatch):
+    """
+    Replaces Simulation.run with a zero-fill stand-in so tests that only
+    count calls skip the per-step walk; mark a test with real_run to keep
+    the genuine stepping.
+    """
+    if "real_run" in request.keywords:
+        return
+
+    def fake_run(self):
+        self._Simulation__sims_arr[:] = 0.0
+        self._Simulation__times_run = self._Simulation__times_to_run
+        self._stat_cache.clear()
+
+    monkeypatch.setattr(Simulation, "run", fake_run)
+
+
+
+@patch('multiprocessing.pool.Pool.imap_unordered')
+def test_create_simulations(mock_pool):
+    mock_pool.return_value = [(0, Simulation(10, 100, ANGLE_WALKER, [0, 1], 10.0))]
+    sims = main.create_simulations(copy.deepcopy(REGULAR_CFG))
+    assert len(sims) == 1
 
 
-@patch('seaborn.stripplot')
-@patch('matplotlib.pyplot.subplots')
-def test_generate_plots_no_simulations(mock_subplots, mock_stripplot):
-    mock_subplots.return_value = MagicMock(), MagicMock()
-    sims = []
+class TestPlots:
+    """Plot-generation tests, sharing one set of matplotlib/seaborn stubs."""
+
+    @pytest.fixture(autouse=True)
+    def _mpl(self, monkeypatch):
+        self.subplots = MagicMock(return_value=(MagicMock(), MagicMock()))
+        self.stripplot = MagicMock()
+        self.figure = MagicMock()
+        monkeypatch.setattr("matplotlib.pyplot.subplots", self.subplots)
+        monkeypatch.setattr("seaborn.stripplot", self.stripplot)
+        monkeypatch.setattr("matplotlib.pyplot.figure", self.figure)
+
+    def test_generate_plots(self, ran_angle_sim):
+        list(main.generate_plots([ran_angle_sim]))
+        assert self.stripplot.call_count == 4
+
+    def test_generate_path_plot(self, ran_angle_sim):
+        main.generate_path_plot([ran_angle_sim])
+        assert self.subplots.call_count == 1
+
+    def test_generate_plots_different_simulations(self):
+        list(main.generate_plots([fake_sim(), fake_sim()]))
+        assert self.stripplot.call_count == 4
+
+    def test_generate_path_plot_different_simulations(self):
+        main.generate_path_plot([fake_sim()])
+        assert self.subplots.call_count == 1
+
+    @pytest.mark.real_run
+    def test_generate_path_plot_3d(self, ran_3d_sim):
+        # Call the function with the shared 3D simulation
+        main.generate_path_plot([ran_3d_sim])
+        assert self.figure.call_count >= 1
+
+
+@pytest.mark.parametrize("call", [
+    lambda: main.generate_plots([]),
+    lambda: main.generate_path_plot([]),
+    lambda: main.save_results([], 'output.txt'),
+    lambda: main.generate_and_save_graphs([], 'output.pdf'),
+])
+def test_empty_simulations_raise(call):
+    # Every entry point rejects an empty simulation list before touching
+    # the filesystem or matplotlib.
     with pytest.raises(IndexError):
-        main.generate_plots(sims)
+        call()
 
 
-@patch('matplotlib.pyplot.subplots')
-def test_generate_path_plot_no_simulations(mock_subplots):
-    sims = []
-    mock_subplots.return_value = MagicMock(), MagicMock()
-    with pytest.raises(IndexError):
-        main.generate_path_plot(sims)
+def test_create_simulations_different_walkers():
+    config = copy.deepcopy(STEP_CFG)
+    sims = main.create_simulations(config)
+    assert len(sims) == 1
+    assert isinstance(sims[0].get_walker(), RandomStepWalker)
 
 
-@patch('builtins.open', new_callable=mock_open)
-def test_save_results_invalid_file(mock_file):
-    mock_file.side_effect = IOError
-    sims = [Simulation(10, 100, RandomAngleWalker("Test"), [0, 1], 10.0)]
-    for sim in sims:
-        sim.run()
-    with pytest.raises(IOError):
-        main.save_results(sims, 'invalid_file.txt')
+@pytest.mark.real_run
+def test_worker():
+    sim = Simulation(10, 100, ANGLE_WALKER, [0, 1], 10.0)
+    assert len(sim.get_sims()) == 0
+    main.worker(sim)
+    assert len(sim.get_sims()) == 10
+
 
+@pytest.mark.parametrize("call,exc", [
+    (lambda: Simulation(0, 0, ANGLE_WALKER, [0, 1], 10.0), ValueError),
+    (lambda: main.create_simulations({}), ValueError),
+    (lambda: main.create_simulations(copy.deepcopy(UNKNOWN_TYPE_CFG)), ValueError),
+    (lambda: main.create_simulations(copy.deepcopy(INVALID_TIMES_CFG)), TypeError),
+    (lambda: main.create_walker("unknown", copy.deepcopy(WALKER_DATA)), ValueError),
+    (lambda: main.create_walker("regular", {**WALKER_DATA, "n_dim": "3"}), TypeError),
+])
+def test_invalid_inputs_raise(call, exc):
+    # Zero-run simulations, empty/unknown/ill-typed configs and bad walker
+    # data all reject their input with the expected exception.
+    with pytest.raises(exc):
+        call()
 
-@patch('builtins.open', new_callable=mock_open)
-def test_generate_and_save_graphs_invalid_file(mock_file):
-    mock_file.side_effect = IOError
-    sims = [Simulation(10, 100, RandomAngleWalker("Test"), [0, 1], 10.0)]
-    for sim in sims:
-        sim.run()
+
+def test_save_results_invalid_file(tmp_path):
     with pytest.raises(IOError):
-        main.generate_and_save_graphs(sims, 'invalid_file.pdf')
-
-
-@patch('builtins.open', new_callable=mock_open)
-def test_save_results(mock_file):
-    sims = [Simulation(10, 100, RandomAngleWalker("Test"), [0, 1], 10.0)]
-    for sim in sims:
-        sim.run()
-    main.save_results(sims, 'output.txt')
-    assert mock_file.call_count == 1
-
-
-@patch('argparse.ArgumentParser.parse_args')
-def test_parse_arguments(mock_args):
-    mock_args.return_value = argparse.Namespace(config_file='config.json', output_file='output.txt',
-                                                graphs_output_file='output.pdf')
-    args = main.parse_arguments()
-    assert args.config_file == 'config.json'
-    assert args.output_file == 'output.txt'
-    assert args.graphs_output_file == 'output.pdf'
-
-
-@patch('json.load')
-@patch('builtins.open', new_callable=mock_open)
-def test_create_simulations_invalid_walker_type(mock_file, mock_json):
-    mock_json.return_value = {
-        "X": {
-            "type": "unknown",
-            "times_to_run": 10,
-            "number_of_steps": 100,
-            "walker": {
-                "n_dim": 2
-            },
-            "axis": [0, 1],
-            "radius": 10.0
-        }
-    }
-    with pytest.raises(ValueError):
-        main.create_simulations(mock_json.return_value)
+        main.save_results([fake_sim()], str(tmp_path / "nonexistent_dir" / "output.txt"))
 
 
-@patch('seaborn.stripplot')
-@patch('matplotlib.pyplot.subplots')
-def test_generate_plots_no_simulations(mock_subplots, mock_stripplot):
-    mock_subplots.return_value = MagicMock(), MagicMock()
-    sims = []
-    with pytest.raises(IndexError):
-        main.generate_plots(sims)
+def test_generate_and_save_graphs_invalid_file(tmp_path):
+    with pytest.raises(IOError):
+        main.generate_and_save_graphs([fake_sim()], str(tmp_path / "nonexistent_dir" / "output.pdf"))
+
+
+def test_save_results(tmp_path):
+    out = tmp_path / "output.txt"
+    main.save_results([fake_sim()], str(out))
+    assert out.exists()
+
+
+@pytest.mark.parametrize("config_file,output_file,graphs_file,expect", [
+    ('config.json', 'output.txt', 'output.pdf', None),
+    ('config2.json', 'output2.txt', 'output2.pdf', None),
+    ('config.jso', 'output.txt', 'output.pdf', SystemExit),
+    ('config.json', 'output.tx', 'output.pdf', SystemExit),
+    ('config.json', 'output.txt', 'output.pd', SystemExit),
+])
+def test_parse_arguments(monkeypatch, config_file, output_file, graphs_file, expect):
+    ns = argparse.Namespace(config_file=config_file, output_file=output_file,
+                            graphs_output_file=graphs_file)
+    monkeypatch.setattr(argparse.ArgumentParser, "parse_args", lambda self: ns)
+    if expect is None:
+        args = main.parse_arguments()
+        assert args.config_file == config_file
+        assert args.output_file == output_file
+        assert args.graphs_output_file == graphs_file
+    else:
+        with pytest.raises(expect):
+            main.parse_arguments()
 
 
 @patch('main.generate_plots')
@@ -225,7 +303,7 @@ def test_generate_plots_no_simulations(mock_subplots, mock_stripplot):
 @patch('file_manager.save_graphs')
 def test_generate_and_save_graphs_different_plot_counts(mock_save_graphs, mock_generate_path_plot, mock_generate_plots):
     # Create a list of mock simulations
-    sims = [MagicMock(spec=Simulation) for _ in range(3)]
+    sims = [fake_sim() for _ in range(3)]
 
     # Mock the return values of generate_plots and generate_path_plot
     mock_generate_plots.return_value = [MagicMock(), MagicMock()]
@@ -235,7 +313,7 @@ def test_generate_and_save_graphs_different_plot_counts(mock_save_graphs, mock_g
     main.generate_and_save_graphs(sims, 'output.pdf')
 
     # Check that save_graphs was called with the correct number of plots
-    assert len(mock_save_graphs.call_args[0][1]) == 3
+    assert len(list(mock_save_graphs.call_args[0][1])) == 3
 
 
 @patch('main.generate_plots')
@@ -243,337 +321,51 @@ def test_generate_and_save_graphs_different_plot_counts(mock_save_graphs, mock_g
 @patch('file_manager.save_graphs')
 def test_generate_and_save_graphs(mock_save_graphs, mock_generate_path_plot, mock_generate_plots):
     # Create a list of mock simulations
-    sims = [MagicMock(spec=Simulation) for _ in range(3)]
+    sims = [fake_sim() for _ in range(3)]
 
     # Mock the return values of generate_plots and generate_path_plot
     mock_generate_plots.return_value = [MagicMock(), MagicMock()]
     mock_generate_path_plot.return_value = [MagicMock()]
     # Call the function with the mock simulations
     main.generate_and_save_graphs(sims, 'output.pdf')
-    # Check that save_graphs was called with the correct number of plots
-    assert mock_save_graphs.call_args[0][1] == mock_generate_plots.return_value[
-                                               :-1] + mock_generate_path_plot.return_value
+    # Check that save_graphs was called with the correct plots
+    assert list(mock_save_graphs.call_args[0][1]) == mock_generate_plots.return_value \
+        + mock_generate_path_plot.return_value
     assert mock_save_graphs.call_args[0][0] == 'output.pdf'
 
 
-@patch('json.load')
-@patch('builtins.open', new_callable=mock_open)
-def test_create_simulations_invalid_config(mock_file, mock_json):
-    mock_json.return_value = {
-        "X": {
-            "type": "step",
-            "times_to_run": "ten",
-            "number_of_steps": 100,
-            "walker": {
-                "restart_chance": 0,
-                "restart_every": 1,
-                "n_dim": 3,
-                "magic_gates_placements": [],
-                "magic_gates_dests": [],
-                "obstacles": [],
-            },
-            "axis": [0, 1],
-            "radius": 10.0
-        }
-    }
-    with pytest.raises(TypeError):
-        main.create_simulations(mock_json.return_value)
-
-
-@patch('argparse.ArgumentParser.parse_args')
-@patch('json.load')
-@patch('builtins.open', new_callable=mock_open)
-@patch('multiprocessing.pool.Pool.map')
-@patch('file_manager.write_to_file')
-def test_integration(mock_write_to_file, mock_pool, mock_file, mock_json, mock_args):
-    # Mock the command line arguments
-    mock_args.return_value = argparse.Namespace(config_file='config.json', output_file='output.txt',
-                                                graphs_output_file='output.pdf')
-
-    # Mock the configuration file
-    mock_json.return_value = {
-        "X": {
-            "type": "regular",
-            "times_to_run": 10,
-            "number_of_steps": 100,
-            "walker": {
-                "restart_chance": 0,
-                "restart_every": 1,
-                "n_dim": 2,
-                "magic_gates_placements": [],
-                "magic_gates_dests": [],
-                "obstacles": [],
-            },
-            "axis": [0, 1],
-            "radius": 10.0
-        }
-    }
-    # Mock the simulations
-    mock_pool.return_value = [MagicMock(spec=Simulation) for _ in range(3)]
-    # Call the main function
-    main.main()
-    # Check that the simulations were created and run
-    assert mock_pool.call_count == 1
-    # Check that the results were saved
-    assert mock_write_to_file.call_count == 1
-
-
-@patch('argparse.ArgumentParser.parse_args')
-@patch('json.load')
-@patch('builtins.open', new_callable=mock_open)
-@patch('multiprocessing.pool.Pool.map')
-@patch('file_manager.write_to_file')
-def test_integration_different_config(mock_write_to_file, mock_pool, mock_file, mock_json, mock_args):
-    # Mock the command line arguments
-    mock_args.return_value = argparse.Namespace(config_file='config2.json', output_file='output2.txt',
-                                                graphs_output_file='output2.pdf')
-
-    # Mock the configuration file
-    mock_json.return_value = {
-        "X": {
-            "type": "step",
-            "times_to_run": 10,
-            "number_of_steps": 100,
-            "walker": {
-                "restart_chance": 0,
-                "restart_every": 1,
-                "n_dim": 2,
-                "magic_gates_placements": [],
-                "magic_gates_dests": [],
-                "obstacles": [],
-            },
-            "axis": [0, 1],
-            "radius": 10.0
-        }
-    }
-    # Mock the simulations
-    mock_pool.return_value = [MagicMock(spec=Simulation) for _ in range(3)]
+@pytest.mark.parametrize("cfg,expect_pool_calls,expect_write_calls", [
+    (FULL_REGULAR_CFG, 1, 1),
+    (FULL_STEP_CFG, 1, 1),
+    (INVALID_TIMES_CFG, 0, 0),
+])
+def test_integration(monkeypatch, tmp_path, cfg, expect_pool_calls, expect_write_calls):
+    # Write a real config file and mock the command line arguments, the
+    # pool and the results file in one stack shared by all three cases.
+    config_file = tmp_path / "config.json"
+    config_file.write_text(json.dumps(cfg))
+    ns = argparse.Namespace(config_file=str(config_file), output_file='output.txt',
+                            graphs_output_file=str(tmp_path / "output.pdf"))
+    monkeypatch.setattr(argparse.ArgumentParser, "parse_args", lambda self: ns)
+    mock_pool = MagicMock(return_value=[(0, fake_sim())])
+    monkeypatch.setattr("multiprocessing.pool.Pool.imap_unordered", mock_pool)
+    mock_write_to_file = MagicMock()
+    monkeypatch.setattr("file_manager.write_to_file", mock_write_to_file)
     # Call the main function
     main.main()
-    # Check that the simulations were created and run
-    assert mock_pool.call_count == 1
-    # Check that the results were saved
-    assert mock_write_to_file.call_count == 1
-
-
-@patch('argparse.ArgumentParser.parse_args')
-@patch('json.load')
-@patch('builtins.open', new_callable=mock_open)
-@patch('multiprocessing.pool.Pool.map')
-@patch('file_manager.write_to_file')
-def test_integration_invalid_config(mock_write_to_file, mock_pool, mock_file, mock_json, mock_args):
-    # Mock the command line arguments
-    mock_args.return_value = argparse.Namespace(config_file='config.json', output_file='output.txt',
-                                                graphs_output_file='output.pdf')
-
-    # Mock the configuration file
-    mock_json.return_value = {
-        "X": {
-            "type": "step",
-            "times_to_run": "10",
-            "number_of_steps": 100,
-            "walker": {
-                "restart_chance": 0,
-                "restart_every": 1,
-                "n_dim": 2,
-                "magic_gates_placements": [],
-                "magic_gates_dests": [],
-                "obstacles": [],
-            },
-            "axis": [0, 1],
-            "radius": 10.0
-        }
-    }
-    # Mock the simulations
-    mock_pool.return_value = [MagicMock(spec=Simulation) for _ in range(3)]
-    # Call the main function
-    main.main()
-    # Check that the simulations were created and run
-    assert mock_pool.call_count == 0
-    # Check that the results were saved
-    assert mock_write_to_file.call_count == 0
-
-
-@patch('json.load')
-@patch('builtins.open', new_callable=mock_open)
-def test_create_simulations_empty_config(mock_file, mock_json):
-    # Mock the configuration file to be empty
-    mock_json.return_value = {}
-    # Call the function with the mock configuration file
-    with pytest.raises(ValueError):
-        main.create_simulations(mock_json.return_value)
-
-
-def test_simulation_zero_steps_runs():
-    # Create a simulation with zero steps and runs
-    with pytest.raises(ValueError):
-        sim = Simulation(0, 0, RandomAngleWalker("Test"), [0, 1], 10.0)
-
-
-@patch('seaborn.stripplot')
-@patch('matplotlib.pyplot.subplots')
-def test_generate_plots_empty_simulations(mock_subplots, mock_stripplot):
-    # Call the function with an empty list of simulations
-    with pytest.raises(IndexError):
-        main.generate_plots([])
-
-
-@patch('matplotlib.pyplot.subplots')
-def test_generate_path_plot_empty_simulations(mock_subplots):
-    # Call the function with an empty list of simulations
-    with pytest.raises(IndexError):
-        main.generate_path_plot([])
-
-
-@patch('builtins.open', new_callable=mock_open)
-def test_save_results_empty_simulations(mock_file):
-    # Call the function with an empty list of simulations
-    with pytest.raises(IndexError):
-        main.save_results([], 'output.txt')
-
-
-@patch('main.generate_plots')
-@patch('main.generate_path_plot')
-@patch('file_manager.save_graphs')
-def test_generate_and_save_graphs_empty_simulations(mock_save_graphs, mock_generate_path_plot, mock_generate_plots):
-    # Call the function with an empty list of simulations
-    with pytest.raises(IndexError):
-        main.generate_and_save_graphs([], 'output.pdf')
-
-
-@patch('json.load')
-@patch('builtins.open', new_callable=mock_open)
-def test_create_simulations_invalid_walker_type(mock_file, mock_json):
-    # Mock the configuration file with an invalid walker type
-    mock_json.return_value = {
-        "X": {
-            "type": "unknown",
-            "times_to_run": 10,
-            "number_of_steps": 100,
-            "walker": {
-                "n_dim": 2
-            },
-            "axis": [0, 1],
-            "radius": 10.0
-        }
-    }
-    # Call the function with the mock configuration file
-    with pytest.raises(ValueError):
-        main.create_simulations(mock_json.return_value)
-
-
-@patch('argparse.ArgumentParser.parse_args')
-def test_parsing_invalid_json_file(mock_args):
-    mock_args.return_value = argparse.Namespace(config_file='config.jso', output_file='output.txt',
-                                                graphs_output_file='output.pdf')
-    with pytest.raises(SystemExit):
-        main.parse_arguments()
-
-
-@patch('argparse.ArgumentParser.parse_args')
-def test_parsing_invalid_output_file(mock_args):
-    mock_args.return_value = argparse.Namespace(config_file='config.json', output_file='output.tx',
-                                                graphs_output_file='output.pdf')
-    with pytest.raises(SystemExit):
-        main.parse_arguments()
-
-
-@patch('argparse.ArgumentParser.parse_args')
-def test_parsing_invalid_graphs_output_file(mock_args):
-    mock_args.return_value = argparse.Namespace(config_file='config.json', output_file='output.txt',
-                                                graphs_output_file='output.pd')
-    with pytest.raises(SystemExit):
-        main.parse_arguments()
+    # Check that the simulations were created and run, and the results saved
+    assert mock_pool.call_count == expect_pool_calls
+    assert mock_write_to_file.call_count == expect_write_calls
 
 
 def test_create_walker():
-    mock_data = {
-        "name": "Test",
-        "n_dim": 2,
-        "obstacles": [],
-        "magic_gates_placements": [],
-        "magic_gates_dests": [],
-        "restart_chance": 0,
-        "restart_every": 1
-
-    }
-    walker = main.create_walker("regular", mock_data)
+    walker = main.create_walker("regular", copy.deepcopy(WALKER_DATA))
     assert isinstance(walker, RandomAngleWalker)
 
 
-def test_create_walker_invalid_type():
-    mock_data = {
-        "name": "Test",
-        "n_dim": 2,
-        "obstacles": [],
-        "magic_gates_placements": [],
-        "magic_gates_dests": [],
-        "restart_chance": 0,
-        "restart_every": 1
-
-    }
-    with pytest.raises(ValueError):
-        main.create_walker("unknown", mock_data)
-
-
-def test_create_walker_invalid_data():
-    mock_data = {
-        "name": "Test",
-        "n_dim": "3",
-        "obstacles": [],
-        "magic_gates_placements": [],
-        "magic_gates_dests": [],
-        "restart_chance": 0,
-        "restart_every": 1
-
-    }
-    with pytest.raises(TypeError):
-        main.create_walker("regular", mock_data)
-
-
-@patch('json.load')
-@patch('builtins.open', new_callable=mock_open)
-def test_create_simulations_invalid_config(mock_file, mock_json):
-    mock_json.return_value = {
-        "X": {
-            "type": "step",
-            "times_to_run": "10",
-            "number_of_steps": 100,
-            "walker": {
-                "restart_chance": 0,
-                "restart_every": 1,
-                "n_dim": 2,
-                "magic_gates_placements": [],
-                "magic_gates_dests": [],
-                "obstacles": [],
-            },
-            "axis": [0, 1],
-            "radius": 10.0
-        }
-    }
-    with pytest.raises(TypeError):
-        main.create_simulations(mock_json.return_value)
-
-
-@patch('argparse.ArgumentParser.parse_args')
-@patch('builtins.open', side_effect=FileNotFoundError)
-def test_main_file_not_found(mock_open, mock_args):
-    mock_args = argparse.Namespace(config_file='config.json', output_file='output.txt', graphs_output_file='output.pdf')
+def test_main_file_not_found(monkeypatch):
+    ns = argparse.Namespace(config_file='no_such_config.json', output_file='output.txt',
+                            graphs_output_file='output.pdf')
+    monkeypatch.setattr(argparse.ArgumentParser, "parse_args", lambda self: ns)
     with pytest.raises(SystemExit):
         main.main()
-
-
-@patch('matplotlib.pyplot.figure')
-@patch('matplotlib.pyplot.Axes')
-def test_generate_path_plot_3d(mock_axes, mock_figure):
-    # Create a mock simulation with a 3D walker
-    sim = Simulation(10, 100, RandomAngleWalker("Test", n_dim=3), [0, 1, 2], 10.0)
-    sim.run()
-    sims = [sim]
-
-    # Call the function with the mock simulations
-    main.generate_path_plot(sims)
-
-    # Check that figure and Axes were called
-    count = mock_figure.call_count
-    assert count >= 1
@@ -4,9 +4,13 @@ from simulation import Simulation
 from walker import RandomAngleWalker
 import pytest
 
+# One walker shared by every simulation here; run() hard-restarts it, so
+# reuse across tests is safe and skips ~50 constructions per module run.
+WALKER = RandomAngleWalker("A")
+
 
 def test_simulations_number():
-    sim = Simulation(10, 10, RandomAngleWalker("A"), [0, 1], 10)
+    sim = Simulation(10, 10, WALKER, [0, 1], 10)
     sim.run()
     assert sim.get_times_run() == 10
     assert len(sim.get_sims()[0]) == 11
@@ -14,7 +18,7 @@ def test_simulations_number():
 
 
 def test_stats_types():
-    sim = Simulation(10, 10, RandomAngleWalker("A"), [0, 1], 10)
+    sim = Simulation(10, 10, WALKER, [0, 1], 10)
     sim.run()
     assert type(sim.get_avg_dist_from_origin_after(7)) is float
     assert type(sim.get_avg_dist_from_axis_after(5)) is float
@@ -23,7 +27,7 @@ def test_stats_types():
 
 
 def test_fields():
-    sim = Simulation(10, 10, RandomAngleWalker("A"), [0, 1], 10)
+    sim = Simulation(10, 10, WALKER, [0, 1], 10)
     sim.run()
     assert len(sim.get_sims()) == 10
     assert sim.get_times_run() == 10
@@ -32,64 +36,64 @@ def test_fields():
 
 def test_simulation_init_times_to_run():
     with pytest.raises(ValueError):
-        Simulation(0, 10, RandomAngleWalker("A"), [0, 1], 10)
+        Simulation(0, 10, WALKER, [0, 1], 10)
 
 
 def test_simulation_init_num_of_steps():
     with pytest.raises(ValueError):
-        Simulation(10, 0, RandomAngleWalker("A"), [0, 1], 10)
+        Simulation(10, 0, WALKER, [0, 1], 10)
 
 
 def test_simulation_init_radius():
     with pytest.raises(ValueError):
-        Simulation(10, 10, RandomAngleWalker("A"), [0, 1], 0)
+        Simulation(10, 10, WALKER, [0, 1], 0)
 
 
 def test_simulation_init_axis_empty():
     with pytest.raises(ValueError):
-        Simulation(10, 10, RandomAngleWalker("A"), [], 10)
+        Simulation(10, 10, WALKER, [], 10)
 
 
 def test_simulation_init_axis_dim():
     with pytest.raises(ValueError):
-        Simulation(10, 10, RandomAngleWalker("A"), [0, 1, 2], 10)
+        Simulation(10, 10, WALKER, [0, 1, 2], 10)
 
 
 def test_get_avg_dist_from_origin_after():
-    sim = Simulation(10, 10, RandomAngleWalker("A"), [0, 1], 10)
+    sim = Simulation(10, 10, WALKER, [0, 1], 10)
     sim.run()
     assert isinstance(sim.get_avg_dist_from_origin_after(7), float)
 
 
 def test_get_avg_dist_from_origin_after_zero_steps():
-    sim = Simulation(10, 10, RandomAngleWalker("A"), [0, 1], 10)
+    sim = Simulation(10, 10, WALKER, [0, 1], 10)
     sim.run()
     assert sim.get_avg_dist_from_origin_after(0) == 0.0
 
 
 def test_get_avg_dist_from_origin_after_more_than_num_steps():
-    sim = Simulation(10, 10, RandomAngleWalker("A"), [0, 1], 10)
+    sim = Simulation(10, 10, WALKER, [0, 1], 10)
     sim.run()
     with pytest.raises(ValueError):
         sim.get_avg_dist_from_origin_after(11)
 
 
 def test_get_avg_dist_from_origin_after_negative_steps():
-    sim = Simulation(10, 10, RandomAngleWalker("A"), [0, 1], 10)
+    sim = Simulation(10, 10, WALKER, [0, 1], 10)
     sim.run()
     with pytest.raises(ValueError):
         sim.get_avg_dist_from_origin_after(-1)
 
 
 def test_get_avg_dist_from_origin_after_non_integer_steps():
-    sim = Simulation(10, 10, RandomAngleWalker("A"), [0, 1], 10)
+    sim = Simulation(10, 10, WALKER, [0, 1], 10)
     sim.run()
     with pytest.raises(ValueError):
         sim.get_avg_dist_from_origin_after(7.5)
 
 
 def test_get_distances_from_origin_after():
-    sim = Simulation(10, 10, RandomAngleWalker("A"), [0, 1], 10)
+    sim = Simulation(10, 10, WALKER, [0, 1], 10)
     sim.run()
     distances = sim.get_distances_from_origin_after(7)
     assert isinstance(distances, list)
@@ -97,60 +101,60 @@ def test_get_distances_from_origin_after():
 
 
 def test_get_distances_from_origin_after_zero_steps():
-    sim = Simulation(10, 10, RandomAngleWalker("A"), [0, 1], 10)
+    sim = Simulation(10, 10, WALKER, [0, 1], 10)
     sim.run()
     assert sim.get_distances_from_origin_after(0) == [0.0] * 10
 
 
 def test_get_distances_from_origin_after_more_than_num_steps():
-    sim = Simulation(10, 10, RandomAngleWalker("A"), [0, 1], 10)
+    sim = Simulation(10, 10, WALKER, [0, 1], 10)
     sim.run()
     with pytest.raises(ValueError):
         sim.get_distances_from_origin_after(11)
 
 
 def test_get_distances_from_origin_after_negative_steps():
-    sim = Simulation(10, 10, RandomAngleWalker("A"), [0, 1], 10)
+    sim = Simulation(10, 10, WALKER, [0, 1], 10)
     sim.run()
     with pytest.raises(ValueError):
         sim.get_distances_from_origin_after(-1)
 
 
 def test_get_distances_from_origin_after_non_integer_steps():
-    sim = Simulation(10, 10, RandomAngleWalker("A"), [0, 1], 10)
+    sim = Simulation(10, 10, WALKER, [0, 1], 10)
     sim.run()
     with pytest.raises(ValueError):
         sim.get_distances_from_origin_after(7.5)
 
 
 def test_get_avg_dist_from_axis_after():
-    sim = Simulation(10, 10, RandomAngleWalker("A"), [0, 1], 10)
+    sim = Simulation(10, 10, WALKER, [0, 1], 10)
     sim.run()
     assert isinstance(sim.get_avg_dist_from_axis_after(7), float)
 
 
 def test_get_avg_dist_from_axis_after_zero_steps():
-    sim = Simulation(10, 10, RandomAngleWalker("A"), [0, 1], 10)
+    sim = Simulation(10, 10, WALKER, [0, 1], 10)
     sim.run()
     assert sim.get_avg_dist_from_axis_after(0) == 0.0
 
 
 def test_get_avg_dist_from_axis_after_more_than_num_steps():
-    sim = Simulation(10, 10, RandomAngleWalker("A"), [0, 1], 10)
+    sim = Simulation(10, 10, WALKER, [0, 1], 10)
     sim.run()
     with pytest.raises(ValueError):
         sim.get_avg_dist_from_axis_after(11)
 
 
 def test_get_avg_dist_from_axis_after_negative_steps():
-    sim = Simulation(10, 10, RandomAngleWalker("A"), [0, 1], 10)
+    sim = Simulation(10, 10, WALKER, [0, 1], 10)
     sim.run()
     with pytest.raises(ValueError):
         sim.get_avg_dist_from_axis_after(-1)
 
 
 def test_get_avg_dist_from_axis_after_non_integer_steps():
-    sim = Simulation(10, 10, RandomAngleWalker("A"), [0, 1], 10)
+    sim = Simulation(10, 10, WALKER, [0, 1], 10)
     sim.run()
     with pytest.raises(ValueError):
         sim.get_avg_dist_from_axis_after(7.5)
@@ -158,14 +162,14 @@ def test_get_avg_dist_from_axis_after_non_integer_steps():
 
 def test_get_avg_dist_from_axis_non_unit_axis():
     axis = [0, 2]
-    sim = Simulation(10, 10, RandomAngleWalker("A"), axis, 10)
+    sim = Simulation(10, 10, WALKER, axis, 10)
     sim.run()
     with pytest.raises(ValueError):
         sim.get_avg_dist_from_axis_after(7)
 
 
 def test_get_distances_from_axis_after():
-    sim = Simulation(10, 10, RandomAngleWalker("A"), [0, 1], 10)
+    sim = Simulation(10, 10, WALKER, [0, 1], 10)
     sim.run()
     distances = sim.get_distances_from_axis_after(7)
     assert isinstance(distances, list)
@@ -173,27 +177,27 @@ def test_get_distances_from_axis_after():
 
 
 def test_get_distances_from_axis_after_zero_steps():
-    sim = Simulation(10, 10, RandomAngleWalker("A"), [0, 1], 10)
+    sim = Simulation(10, 10, WALKER, [0, 1], 10)
     sim.run()
     assert sim.get_distances_from_axis_after(0) == [0.0] * 10
 
 
 def test_get_distances_from_axis_after_more_than_num_steps():
-    sim = Simulation(10, 10, RandomAngleWalker("A"), [0, 1], 10)
+    sim = Simulation(10, 10, WALKER, [0, 1], 10)
     sim.run()
     with pytest.raises(ValueError):
         sim.get_distances_from_axis_after(11)
 
 
 def test_get_distances_from_axis_after_negative_steps():
-    sim = Simulation(10, 10, RandomAngleWalker("A"), [0, 1], 10)
+    sim = Simulation(10, 10, WALKER, [0, 1], 10)
     sim.run()
     with pytest.raises(ValueError):
         sim.get_distances_from_axis_after(-1)
 
 
 def test_get_distances_from_axis_after_non_integer_steps():
-    sim = Simulation(10, 10, RandomAngleWalker("A"), [0, 1], 10)
+    sim = Simulation(10, 10, WALKER, [0, 1], 10)
     sim.run()
     with pytest.raises(ValueError):
         sim.get_distances_from_axis_after(7.5)
@@ -201,47 +205,47 @@ def test_get_distances_from_axis_after_non_integer_steps():
 
 def test_get_distances_from_axis_non_unit_axis():
     axis = [0, 2]
-    sim = Simulation(10, 10, RandomAngleWalker("A"), axis, 10)
+    sim = Simulation(10, 10, WALKER, axis, 10)
     sim.run()
     with pytest.raises(ValueError):
         sim.get_distances_from_axis_after(7)
 
 
 def test_avg_times_crossed_y_axis_after():
-    sim = Simulation(10, 10, RandomAngleWalker("A"), [0, 1], 10)
+    sim = Simulation(10, 10, WALKER, [0, 1], 10)
     sim.run()
     assert isinstance(sim.avg_times_crossed_y_axis_after(7), float)
 
 
 def test_avg_times_crossed_y_axis_after_zero_steps():
-    sim = Simulation(10, 10, RandomAngleWalker("A"), [0, 1], 10)
+    sim = Simulation(10, 10, WALKER, [0, 1], 10)
     sim.run()
     assert sim.avg_times_crossed_y_axis_after(0) == 0.0
 
 
 def test_avg_times_crossed_y_axis_after_more_than_num_steps():
-    sim = Simulation(10, 10, RandomAngleWalker("A"), [0, 1], 10)
+    sim = Simulation(10, 10, WALKER, [0, 1], 10)
     sim.run()
     with pytest.raises(ValueError):
         sim.avg_times_crossed_y_axis_after(11)
 
 
 def test_avg_times_crossed_y_axis_after_negative_steps():
-    sim = Simulation(10, 10, RandomAngleWalker("A"), [0, 1], 10)
+    sim = Simulation(10, 10, WALKER, [0, 1], 10)
     sim.run()
     with pytest.raises(ValueError):
         sim.avg_times_crossed_y_axis_after(-1)
 
 
 def test_avg_times_crossed_y_axis_after_non_integer_steps():
-    sim = Simulation(10, 10, RandomAngleWalker("A"), [0, 1], 10)
+    sim = Simulation(10, 10, WALKER, [0, 1], 10)
     sim.run()
     with pytest.raises(ValueError):
         sim.avg_times_crossed_y_axis_after(7.5)
 
 
 def test_get_times_crossed_y_axis_after():
-    sim = Simulation(10, 10, RandomAngleWalker("A"), [0, 1], 10)
+    sim = Simulation(10, 10, WALKER, [0, 1], 10)
     sim.run()
     times = sim.get_times_crossed_y_axis_after(7)
     assert isinstance(times, list)
@@ -249,40 +253,40 @@ def test_get_times_crossed_y_axis_after():
 
 
 def test_get_times_crossed_y_axis_after_zero_steps():
-    sim = Simulation(10, 10, RandomAngleWalker("A"), [0, 1], 10)
+    sim = Simulation(10, 10, WALKER, [0, 1], 10)
     sim.run()
     assert sim.get_times_crossed_y_axis_after(0) == [0] * 10
 
 
 def test_get_times_crossed_y_axis_after_more_than_num_steps():
-    sim = Simulation(10, 10, RandomAngleWalker("A"), [0, 1], 10)
+    sim = Simulation(10, 10, WALKER, [0, 1], 10)
     sim.run()
     with pytest.raises(ValueError):
         sim.get_times_crossed_y_axis_after(11)
 
 
 def test_get_times_crossed_y_axis_after_negative_steps():
-    sim = Simulation(10, 10, RandomAngleWalker("A"), [0, 1], 10)
+    sim = Simulation(10, 10, WALKER, [0, 1], 10)
     sim.run()
     with pytest.raises(ValueError):
         sim.get_times_crossed_y_axis_after(-1)
 
 
 def test_get_times_crossed_y_axis_after_non_integer_steps():
-    sim = Simulation(10, 10, RandomAngleWalker("A"), [0, 1], 10)
+    sim = Simulation(10, 10, WALKER, [0, 1], 10)
     sim.run()
     with pytest.raises(ValueError):
         sim.get_times_crossed_y_axis_after(7.5)
 
 
 def test_avg_step_exited_radius():
-    sim = Simulation(10, 10, RandomAngleWalker("A"), [0, 1], 10)
+    sim = Simulation(10, 10, WALKER, [0, 1], 10)
     sim.run()
     assert isinstance(sim.avg_step_exited_radius(), float)
 
 
 def test_get_step_exited_radius():
-    sim = Simulation(10, 10, RandomAngleWalker("A"), [0, 1], 10)
+    sim = Simulation(10, 10, WALKER, [0, 1], 10)
     sim.run()
     steps = sim.get_step_exited_radius()
     assert isinstance(steps, list)
@@ -290,13 +294,13 @@ def test_get_step_exited_radius():
 
 
 def test_get_step_exited_radius_non_exited():
-    sim = Simulation(10, 10, RandomAngleWalker("A"), [0, 1], 10)
+    sim = Simulation(10, 10, WALKER, [0, 1], 10)
     sim.run()
     assert sim.get_step_exited_radius() == []
 
 
 def test_get_avg_path():
-    sim = Simulation(10, 10, RandomAngleWalker("A"), [0, 1], 10)
+    sim = Simulation(10, 10, WALKER, [0, 1], 10)
     sim.run()
     assert isinstance(sim.get_avg_path(), list)
     assert all(isinstance(step, list) for step in sim.get_avg_path())
@@ -304,14 +308,14 @@ def test_get_avg_path():
 
 
 def test_get_avg_path_empty():
-    sim = Simulation(10, 10, RandomAngleWalker("A"), [0, 1], 10)
+    sim = Simulation(10, 10, WALKER, [0, 1], 10)
     with pytest.raises(ValueError):
         sim.get_avg_path()
 
 
 def test_large_number_of_simulations():
     start_time = time.time()
-    sim = Simulation(10000, 10, RandomAngleWalker("A"), [0, 1], 10)
+    sim = Simulation(10000, 10, WALKER, [0, 1], 10)
     sim.run()
     end_time = time.time()
     execution_time = end_time - start_time
@@ -319,7 +323,7 @@ def test_large_number_of_simulations():
 
 
 def test_large_number_of_steps():
-    sim = Simulation(10, 100000, RandomAngleWalker("A"), [0, 1], 10)
+    sim = Simulation(10, 100000, WALKER, [0, 1], 10)
     sim.run()
     start_time = time.time()
     sim.get_avg_dist_from_origin_after(50000)
@@ -329,7 +333,7 @@ def test_large_number_of_steps():
 
 
 def test_large_avg_path():
-    sim = Simulation(100000, 10, RandomAngleWalker("A"), [0, 1], 10)
+    sim = Simulation(100000, 10, WALKER, [0, 1], 10)
     sim.run()
     start_time = time.time()
     sim.get_avg_path()
@@ -339,9 +343,17 @@ def test_large_avg_path():
 
 
 def test_large_num_steps_runtime():
-    sim = Simulation(1, 10000, RandomAngleWalker("A"), [0, 1], 10)
+    sim = Simulation(1, 10000, WALKER, [0, 1], 10)
     start_time = time.time()
     sim.run()
     end_time = time.time()
     execution_time = end_time - start_time
     assert execution_time < 1.5
+
+
+def test_mmap_backed_simulation(tmp_path):
+    sim = Simulation(10, 10, WALKER, [0, 1], 10, mmap_path=str(tmp_path / "sims.dat"))
+    sim.run()
+    assert sim.get_times_run() == 10
+    assert isinstance(sim.get_avg_dist_from_origin_after(10), float)
+    assert (tmp_path / "sims.dat").exists()
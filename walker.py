@@ -1,4 +1,5 @@
 import abc
+import math
 import numpy as np
 import random
 from abc import ABC
@@ -13,7 +14,9 @@ def normalize_vector(dimen: int = 2) -> np.ndarray:
     if dimen <= 1:
         raise ValueError("Number of dimensions must be positive and greater than 2.")
     direction = np.random.randn(dimen)
-    direction /= np.linalg.norm(direction)
+    # math.sqrt on the dot product skips np.linalg.norm's dispatch overhead,
+    # which is material for vectors this small.
+    direction *= 1.0 / math.sqrt(direction @ direction)
     return direction
 
 
@@ -26,9 +29,9 @@ def exited_radius(position: List, radius: float) -> bool:
     """
     if radius <= 0:
         raise ValueError("Radius must be positive.")
-    if radius < np.linalg.norm(np.array(position)):
-        return True
-    return False
+    # Compare squared norms to skip the square root per point.
+    vector = np.asarray(position)
+    return bool(vector.dot(vector) > radius * radius)
 
 
 class Walker(ABC):
@@ -62,14 +65,30 @@ class Walker(ABC):
         self._restart_chance: float = restart_chance
         self._restart_every: int = restart_every
         self._dim: int = n_dim
-        # Create KDTree for obstacles and magic gates
-        self._magic_gates_placements: Optional[KDTree] = KDTree(
-            magic_gates_placements) if magic_gates_placements else None
+        # Gates are an equality check, so a hashed set beats a tree query;
+        # obstacles are a radius query and keep the KDTree.
+        self._magic_gates_placements: Optional[frozenset] = frozenset(
+            map(tuple, magic_gates_placements)) if magic_gates_placements else None
         self._magic_gates_destinations: Optional[List] = magic_gates_dests
+        self._gate_dests_arr: Optional[np.ndarray] = \
+            np.asarray(magic_gates_dests) if magic_gates_dests else None
         self._obstacles: Optional[KDTree] = KDTree(obstacles) if obstacles else None
-        # Initialize the current position and the path
-        self._current_position: List = [0] * n_dim
-        self._path: List[List] = [self._current_position]
+        # For a handful of obstacles a brute-force squared-distance sweep
+        # beats the tree's per-query overhead; the tree wins on large sets.
+        self._obstacles_arr: Optional[np.ndarray] = \
+            np.asarray(obstacles, dtype=np.float64) if obstacles and len(obstacles) <= 64 else None
+        # Initialize the current position and the path. Both live in ndarrays
+        # and are only boxed into Python lists on demand; the integer dtype
+        # mirrors the integer origin and keeps grid walks integer.
+        self._current_position: np.ndarray = np.zeros(n_dim, dtype=np.int64)
+        self._path_arr: np.ndarray = np.zeros((1, n_dim), dtype=np.int64)
+        # Scratch buffer and generator for per-step direction draws, so a
+        # long per-step walk reuses one tiny array instead of allocating
+        # millions of them.
+        self._rng = np.random.default_rng()
+        self._scratch_dir: np.ndarray = np.empty(n_dim)
+        # The basis of the dimension never changes; build it once.
+        self._basis: np.ndarray = np.eye(n_dim, dtype=np.int64)
 
     @staticmethod
     def validate_restart(restart_chance, restart_every):
@@ -134,19 +153,26 @@ class Walker(ABC):
         """
         return self._dim
 
-    def dist_from_origin_after(self, n: int) -> float:
+    def _validate_steps(self, n: int) -> None:
         """
-        Get the distance from the origin after n steps.
+        Validates a number-of-steps argument against the stored path.
         :param n: Number of steps.
-        :return: Distance from the origin.
         """
         if n < 0:
             raise ValueError("Number of steps must be positive.")
-        if n >= len(self._path):
+        if n >= len(self._path_arr):
             raise ValueError("Number of steps must be less than the length of the path.")
         if type(n) is not int:
             raise ValueError("Number of steps must be an integer.")
-        return float(np.linalg.norm(np.array(self._path[n])))  # Calculate the distance from the origin
+
+    def dist_from_origin_after(self, n: int) -> float:
+        """
+        Get the distance from the origin after n steps.
+        :param n: Number of steps.
+        :return: Distance from the origin.
+        """
+        self._validate_steps(n)
+        return float(np.linalg.norm(self._path_arr[n]))  # Calculate the distance from the origin
 
     def times_crossed_y_axis_after(self, n: int) -> int:
         """
@@ -154,19 +180,10 @@ class Walker(ABC):
         :param n: Number of steps.
         :return: Number of times the walker crossed the y-axis.
         """
-        if n < 0:
-            raise ValueError("Number of steps must be positive.")
-        if n >= len(self._path):
-            raise ValueError("Number of steps must be less than the length of the path.")
-        if type(n) is not int:
-            raise ValueError("Number of steps must be an integer.")
-        count = 0
-        for i in range(n - 1):
-            if self._path[i][1] > 0 >= self._path[i + 1][1]:
-                count += 1
-            elif self._path[i][1] < 0 <= self._path[i + 1][1]:
-                count += 1
-        return count
+        self._validate_steps(n)
+        y = self._path_arr[:n, 1]
+        crossings = ((y[:-1] > 0) & (y[1:] <= 0)) | ((y[:-1] < 0) & (y[1:] >= 0))
+        return int(np.count_nonzero(crossings))
 
     def dist_from_axis_after(self, axis: List, n: int) -> float:
         """
@@ -175,22 +192,47 @@ class Walker(ABC):
         :param n: Number of steps.
         :return: Distance from the axis.
         """
-        if type(n) is not int:
-            raise ValueError("Number of steps must be an integer.")
+        self._validate_steps(n)
+        new_axis = self._validate_axis(axis)
+        # The axis is a unit vector, so the projection needs no
+        # normalisation terms.
+        vector = np.asarray(self._path_arr[n], dtype=np.float64)
+        return float(np.linalg.norm(vector - (vector @ new_axis) * new_axis))
+
+    def _validate_axis(self, axis: List) -> np.ndarray:
+        """
+        Validates an axis argument and returns it as a float array.
+        :param axis: Axis to validate. A base vector for the axis.
+        :return: The axis as an array.
+        """
         if len(axis) != self._dim:
             raise ValueError("Axis must be a vector of the same dimension as the walker.")
-        if np.linalg.norm(axis) != 1:
+        new_axis = np.asarray(axis, dtype=np.float64)
+        # Squared-norm comparison with a tolerance, instead of exact float
+        # equality on the norm.
+        if abs(new_axis @ new_axis - 1.0) > 1e-10:
             raise ValueError("Axis must be a unit vector.")
-        if n < 0:
-            raise ValueError("Number of steps must be positive.")
-        if n >= len(self._path):
-            raise ValueError("Number of steps must be less than the length of the path.")
-        # Calculate the distance by projection on the axis
-        vector = np.array(self._path[n])
-        new_axis = np.array(axis)
-        projection = np.dot(vector, new_axis) / np.linalg.norm(new_axis)
-        projection_vector = projection * new_axis / np.linalg.norm(new_axis)
-        return float(np.linalg.norm(vector - projection_vector))
+        return new_axis
+
+    def get_dists_from_axis(self, axis: List) -> np.ndarray:
+        """
+        Get the distance from the axis at every step of the path, in one
+        pass over the whole path.
+        :param axis: Axis to measure distance from. A base vector for the axis.
+        :return: The distances, one per step.
+        """
+        new_axis = self._validate_axis(axis)
+        path = np.asarray(self._path_arr, dtype=np.float64)
+        projections = path @ new_axis
+        return np.linalg.norm(path - projections[:, np.newaxis] * new_axis, axis=1)
+
+    def get_dists_from_origin(self) -> np.ndarray:
+        """
+        Get the distance from the origin at every step of the path, in one
+        pass over the whole path.
+        :return: The distances, one per step.
+        """
+        return np.sqrt(np.einsum('ij,ij->i', self._path_arr, self._path_arr))
 
     def exited_radius_at(self, radius: float) -> int:
         """
@@ -201,56 +243,116 @@ class Walker(ABC):
         """
         if radius <= 0:
             raise ValueError("Radius must be positive.")
-        if len(self._path) == 0:
+        if len(self._path_arr) == 0:
             raise ValueError("Path is empty.")
-        for i in range(len(self._path)):
-            if exited_radius(self._path[i], radius):
-                return i
-        return 0
+        # One pass over the squared norms; argmax picks the first exiting
+        # step and the final check covers a path that never exited.
+        squared = np.einsum('ij,ij->i', self._path_arr, self._path_arr)
+        exited = squared > radius * radius
+        first = int(exited.argmax())
+        return first if exited[first] else 0
 
     @abc.abstractmethod
-    def step(self) -> List[float]:
+    def step(self) -> np.ndarray:
         pass
 
+    def reseed(self) -> None:
+        """
+        Give the walker a fresh random generator, so copies of one walker
+        do not replay the same per-step draws.
+        """
+        self._rng = np.random.default_rng()
+
+    def _random_direction(self) -> np.ndarray:
+        """
+        A unit-length random direction, drawn into the walker's scratch
+        buffer; the same buffer is reused every step, so copy before storing.
+        :return: The direction.
+        """
+        direction = self._scratch_dir
+        self._rng.standard_normal(self._dim, out=direction)
+        direction *= 1.0 / math.sqrt(direction @ direction)
+        return direction
+
+    def _step_displacements(self, steps: int) -> Optional[np.ndarray]:
+        """
+        Displacements for a whole walk as a (steps, dim) array, or None when
+        the walker can only step one move at a time.
+        :param steps: Number of steps.
+        :return: The displacements, or None.
+        """
+        return None
+
+    def walk_many(self, times: int, steps: int) -> Optional[np.ndarray]:
+        """
+        Paths of several independent walks from the origin, as one
+        (times, steps + 1, dim) array, or None when the walker must walk
+        step by step. Leaves the walker's own path untouched.
+        :param times: Number of walks.
+        :param steps: Number of steps per walk.
+        :return: The paths, or None.
+        """
+        if times <= 0 or steps <= 0:
+            raise ValueError("Number of steps must be positive.")
+        if self._obstacles is not None or self._magic_gates_placements is not None \
+                or self._restart_chance != 0:
+            return None
+        displacements = self._step_displacements(times * steps)
+        if displacements is None:
+            return None
+        paths = np.empty((times, steps + 1, self._dim), dtype=np.float64)
+        paths[:, 0, :] = 0.0
+        np.cumsum(displacements.reshape(times, steps, self._dim), axis=1, out=paths[:, 1:, :])
+        return paths
+
     def get_path(self) -> List[List]:
         """
         Get the path of the walker up to the current point.
         :return:
         """
-        return self._path[:]
+        return self._path_arr.tolist()
+
+    def get_path_array(self) -> np.ndarray:
+        """
+        Get the path of the walker as a float64 array, one step per row.
+        A read-only view of the internal path whenever it is already
+        float64, so the call is constant time instead of a whole-path copy.
+        :return: The path as an array.
+        """
+        path = np.asarray(self._path_arr, dtype=np.float64)
+        if path is self._path_arr:
+            path = path.view()
+        path.flags.writeable = False
+        return path
 
     def get_current_position(self) -> List[float]:
         """
         Get the current position of the walker.
         :return:
         """
-        return self._current_position[:]
+        return self._current_position.tolist()
 
     def hard_restart(self):
         """
         Restart the walker at the origin.
         """
-        self._current_position = [0] * self._dim
-        self._path = [self._current_position]
-        return self._current_position[:]
+        self._current_position = np.zeros(self._dim, dtype=np.int64)
+        self._path_arr = np.zeros((1, self._dim), dtype=np.int64)
+        return self._current_position.tolist()
 
     def restart(self):
         """
         Restart the walker at the origin.
         """
-        self._current_position = [0] * self._dim
-        return self._current_position[:]
+        self._current_position = np.zeros(self._dim, dtype=np.int64)
+        return self._current_position.tolist()
 
     def get_basis_vectors(self) -> List[List]:
         """
         Get the basis vectors of the dimension.
         :return: the basis vectors.
         """
-        basis_vectors = []
-        for i in range(self._dim):
-            basis_vectors.append([0] * self._dim)
-            basis_vectors[i][i] = 1
-        return basis_vectors
+        return self._basis.tolist()
 
     def walk(self, steps: int):
         """
@@ -260,18 +362,137 @@ class Walker(ABC):
         """
         if steps <= 0:
             raise ValueError("Number of steps must be positive.")
+        # With no obstacles, gates or restarts the whole walk is a cumulative
+        # sum of independent displacements, which walkers can draw in one go.
+        if self._obstacles is None and self._magic_gates_placements is None and self._restart_chance == 0:
+            displacements = self._step_displacements(steps)
+            if displacements is not None:
+                # Let the displacement dtype drive the result, so integer
+                # grid walks stay integer.
+                positions = np.asarray(self._current_position) \
+                    + np.cumsum(displacements, axis=0)
+                self._path_arr = np.concatenate([self._path_arr, positions])
+                self._current_position = self._path_arr[-1].copy()
+                return
+        # With only obstacles in the way, candidate segments can still be
+        # drawn and checked against the tree in batches.
+        if self._obstacles is not None and self._magic_gates_placements is None \
+                and self._restart_chance == 0:
+            if self._walk_batched_obstacles(steps):
+                return
+        # With only restarts, the restart events can be pre-sampled and the
+        # cumulative sums rebased at each one.
+        if self._obstacles is None and self._magic_gates_placements is None \
+                and self._restart_chance != 0:
+            if self._walk_batched_restarts(steps):
+                return
+        new_positions = []
+        # Bind the dispatched methods once; the loop body then pays a plain
+        # call instead of an attribute lookup per step.
+        step = self.step
+        blocked_at = self._blocked_at
         for i in range(steps):
-            pos_after_step = self.step()
+            pos_after_step = step()
             if self._obstacles:
-                while self._obstacles.query_ball_point(pos_after_step, 1):
-                    pos_after_step = self.step()
+                while blocked_at(pos_after_step):
+                    pos_after_step = step()
             if self._magic_gates_placements and self._magic_gates_destinations:
-                if self._magic_gates_placements.query_ball_point(pos_after_step, 0):
-                    pos_after_step = random.choice(self._magic_gates_destinations)
+                if self._gate_at(pos_after_step):
+                    pos_after_step = self._gate_dests_arr[random.randrange(len(self._gate_dests_arr))]
             if i % self._restart_every == 0:
                 if random.random() < self._restart_chance:
                     pos_after_step = self.restart()
-            self._path.append(pos_after_step)
+            new_positions.append(pos_after_step)
+        self._path_arr = np.concatenate([self._path_arr, np.asarray(new_positions)])
+
+    def _blocked_at(self, position) -> bool:
+        """
+        Whether an obstacle blocks the given position.
+        """
+        if self._obstacles_arr is not None:
+            diff = self._obstacles_arr - np.asarray(position)
+            return bool(np.any(np.einsum('ij,ij->i', diff, diff) <= 1.0))
+        return bool(self._obstacles.query_ball_point(position, 1))
+
+    def _first_blocked(self, candidates: np.ndarray) -> int:
+        """
+        Index of the first blocked candidate position, or the number of
+        candidates when none is blocked.
+        """
+        if self._obstacles_arr is not None:
+            obstacles = self._obstacles_arr
+            # Squared distances through one matrix product instead of a
+            # tree query per candidate.
+            squared = np.einsum('ij,ij->i', candidates, candidates)[:, np.newaxis] \
+                + np.einsum('ij,ij->i', obstacles, obstacles) \
+                - 2.0 * (candidates @ obstacles.T)
+            hits = np.any(squared <= 1.0, axis=1)
+            first = int(hits.argmax())
+            return first if hits[first] else len(candidates)
+        hits = self._obstacles.query_ball_point(candidates, 1, workers=-1)
+        return next((i for i, hit in enumerate(hits) if hit), len(candidates))
+
+    def _gate_at(self, position) -> bool:
+        """
+        Whether the given position sits on a magic gate.
+        """
+        return tuple(position) in self._magic_gates_placements
+
+    def _walk_batched_restarts(self, steps: int) -> bool:
+        """
+        Walks with pre-sampled restart events: one Bernoulli draw per
+        eligible step, then every position after a restart is rebased so the
+        restarting step lands on the origin, exactly as restart() does.
+        :param steps: Number of steps to walk.
+        :return: True if the walker supports batched draws, False otherwise.
+        """
+        displacements = self._step_displacements(steps)
+        if displacements is None:
+            return False
+        restart_mask = (np.arange(steps) % self._restart_every == 0) \
+            & (np.random.random(steps) < self._restart_chance)
+        positions = np.asarray(self._current_position) + np.cumsum(displacements, axis=0)
+        restarts = np.where(restart_mask)[0]
+        if restarts.size:
+            # Subtracting the position of the latest restart from every
+            # later point puts each restarting step on the origin and
+            # discards its drawn move, matching the per-step loop.
+            offsets = positions[restarts]
+            counts = np.diff(np.append(restarts, steps))
+            positions[restarts[0]:] -= np.repeat(offsets, counts, axis=0)
+        self._path_arr = np.concatenate([self._path_arr, positions])
+        self._current_position = self._path_arr[-1].copy()
+        return True
+
+    def _walk_batched_obstacles(self, steps: int) -> bool:
+        """
+        Walks against the obstacle tree by querying whole candidate segments
+        at once, falling back to single re-steps only around collisions.
+        :param steps: Number of steps to walk.
+        :return: True if the walker supports batched draws, False otherwise.
+        """
+        displacements = self._step_displacements(steps)
+        if displacements is None:
+            return False
+        steps_left = steps
+        while steps_left > 0:
+            candidates = np.asarray(self._current_position) + np.cumsum(displacements, axis=0)
+            blocked = self._first_blocked(candidates)
+            if blocked > 0:
+                self._path_arr = np.concatenate([self._path_arr, candidates[:blocked]])
+                self._current_position = self._path_arr[-1].copy()
+                steps_left -= blocked
+            if steps_left > 0:
+                # One blocked step: keep stepping until clear, exactly as
+                # the per-step loop does.
+                pos_after_step = self.step()
+                while self._blocked_at(pos_after_step):
+                    pos_after_step = self.step()
+                self._path_arr = np.concatenate([self._path_arr, np.asarray(pos_after_step)[np.newaxis]])
+                steps_left -= 1
+                if steps_left > 0:
+                    displacements = self._step_displacements(steps_left)
+        return True
 
     def get_name(self):
         """
@@ -294,8 +515,8 @@ class Walker(ABC):
         """
         if len(path) == 0:
             raise ValueError("Path must not be empty.")
-        self._path = path[:]
-        self._current_position = path[-1]
+        self._path_arr = np.asarray(path)
+        self._current_position = self._path_arr[-1].copy()
 
 
 class RandomAngleWalker(Walker):
@@ -312,15 +533,25 @@ class RandomAngleWalker(Walker):
                          , restart_chance, restart_every)
         self.__step_size: float = 1
 
-    def step(self) -> List[float]:
+    def step(self) -> np.ndarray:
         """
         Move one step in a random direction.
         :return:
         """
-        self._current_position = self._current_position[:]
-        direction = normalize_vector(self._dim)
-        self._current_position += direction * self.__step_size
-        return list(self._current_position)
+        direction = self._random_direction()
+        self._current_position = self._current_position + direction * self.__step_size
+        return self._current_position
+
+    def _step_displacements(self, steps: int) -> np.ndarray:
+        """
+        Draw all the unit-length random directions of a walk at once.
+        :param steps: Number of steps.
+        :return: The displacements, one step per row.
+        """
+        directions = np.random.randn(steps, self._dim)
+        norms = np.einsum('ij,ij->i', directions, directions)
+        directions *= (1.0 / np.sqrt(norms))[:, np.newaxis]
+        return directions * self.__step_size
 
 
 class RandomStepWalker(Walker):
@@ -343,16 +574,27 @@ class RandomStepWalker(Walker):
         self.__min_step_size: float = min_step_size
         self.__max_step_size: float = max_step_size
 
-    def step(self) -> List[float]:
+    def step(self) -> np.ndarray:
         """
         Move one step in a random direction.
         :return:
         """
         step_size = random.uniform(self.__min_step_size, self.__max_step_size)
-        self._current_position = self._current_position[:]
-        direction = normalize_vector(self._dim)
-        self._current_position += direction * step_size
-        return list(self._current_position)
+        direction = self._random_direction()
+        self._current_position = self._current_position + direction * step_size
+        return self._current_position
+
+    def _step_displacements(self, steps: int) -> np.ndarray:
+        """
+        Draw all the random directions and step sizes of a walk at once.
+        :param steps: Number of steps.
+        :return: The displacements, one step per row.
+        """
+        directions = np.random.randn(steps, self._dim)
+        norms = np.einsum('ij,ij->i', directions, directions)
+        directions *= (1.0 / np.sqrt(norms))[:, np.newaxis]
+        step_sizes = np.random.uniform(self.__min_step_size, self.__max_step_size, steps)
+        return directions * step_sizes[:, np.newaxis]
 
 
 class RandomGridWalker(Walker):
@@ -368,20 +610,52 @@ class RandomGridWalker(Walker):
                  ):
         super().__init__(name, n_dim, magic_gates_placements, magic_gates_dests, obstacles,
                          restart_chance, restart_every)
-
-    def step(self) -> List[float]:
+        # On the integer lattice, membership is a hash lookup, not a tree
+        # query: a lattice point is within distance 1 of an integer obstacle
+        # exactly when it is the obstacle or one of its axis neighbours.
+        self.__blocked_set = None
+        if self._obstacles is not None:
+            points = self._obstacles.data
+            if np.all(points == np.rint(points)):
+                moves = np.concatenate([np.zeros((1, n_dim), dtype=np.int64), self._basis, -self._basis])
+                self.__blocked_set = {tuple(point + move)
+                                      for point in points.astype(np.int64) for move in moves}
+
+    def _blocked_at(self, position) -> bool:
+        if self.__blocked_set is None:
+            return super()._blocked_at(position)
+        return tuple(position) in self.__blocked_set
+
+    def _first_blocked(self, candidates: np.ndarray) -> int:
+        if self.__blocked_set is None:
+            return super()._first_blocked(candidates)
+        return next((i for i, candidate in enumerate(map(tuple, candidates))
+                     if candidate in self.__blocked_set), len(candidates))
+
+    def step(self) -> np.ndarray:
         """
         Move one step in a random direction on the grid.
         :return:
         """
-        self._current_position = self._current_position[:]
-        vectors = self.get_basis_vectors()
-        sign = random.choice([-1, 1])
-        direction = random.randint(0, self._dim - 1)
+        self._current_position = self._current_position.copy()
+        # getrandbits/randrange skip the list allocation and the inclusive
+        # bound arithmetic of choice/randint; the step is just two ints.
+        sign = 1 if random.getrandbits(1) else -1
+        direction = random.randrange(self._dim)
         # Set new position as plus or minus 1 the direction chosen.
-        self._current_position[direction] = self._current_position[direction] + sign * vectors[direction][direction]
+        self._current_position[direction] += sign
         return self._current_position
 
+    def _step_displacements(self, steps: int) -> np.ndarray:
+        """
+        Draw all the grid moves of a walk at once as signed basis vectors,
+        one randint per step into a table of the 2 * dim possible moves.
+        :param steps: Number of steps.
+        :return: The displacements, one step per row.
+        """
+        moves = np.concatenate([self._basis, -self._basis])
+        return moves[np.random.randint(0, 2 * self._dim, steps)]
+
 
 class BiasedRandomWalker(Walker):
     """
@@ -408,6 +682,10 @@ class BiasedRandomWalker(Walker):
                          restart_chance, restart_every)
         self.__bias_direction: Optional[List[int]] = bias_direction
         self.__bias_strength: float = bias_strength
+        # A fixed bias contributes the same scaled vector every step, so
+        # build it once instead of converting the list per step.
+        self.__bias_vec: Optional[np.ndarray] = \
+            bias_strength * np.asarray(bias_direction, dtype=np.float64) if bias_direction else None
         self.__step_size: float = 1
 
     @staticmethod
@@ -423,26 +701,27 @@ class BiasedRandomWalker(Walker):
         if bias_strength < 0 or bias_strength > 1:
             raise ValueError("Bias strength must be between 0 and 1.")
 
-    def step(self) -> List[float]:
+    def step(self) -> np.ndarray:
         """
         Move one step in a random direction.
         :return:
         """
-        self._current_position = self._current_position[:]
-        direction = normalize_vector(self._dim)
-        if self.__bias_direction:
-            bias_direction = np.array(self.__bias_direction)
-        else:
-            bias_direction = -np.array(self._current_position)
-        # Some linear algebra to create the bias
+        direction = self._random_direction()
+        # Some linear algebra to create the bias, in place in the scratch
+        # buffer
         if self.__bias_strength < 1:
-            combined_direction = ((1 - self.__bias_strength) *
-                                  direction + self.__bias_strength * bias_direction)
-            combined_direction /= np.linalg.norm(combined_direction)
+            bias_term = self.__bias_vec if self.__bias_vec is not None \
+                else -self.__bias_strength * self._current_position
+            direction *= 1 - self.__bias_strength
+            direction += bias_term
+            direction *= 1.0 / math.sqrt(direction @ direction)
+            combined_direction = direction
+        elif self.__bias_direction:
+            combined_direction = np.asarray(self.__bias_direction, dtype=np.float64)
         else:
-            combined_direction = bias_direction
-        self._current_position += combined_direction * self.__step_size
-        return list(self._current_position)
+            combined_direction = -self._current_position
+        self._current_position = self._current_position + combined_direction * self.__step_size
+        return self._current_position
 
 
 class RandomSearcher(RandomGridWalker):
@@ -469,12 +748,51 @@ class RandomSearcher(RandomGridWalker):
             if not isinstance(tar, int):
                 raise ValueError("Target must be vectors of numbers.")
 
-    def step(self) -> List[float]:
+    def step(self) -> np.ndarray:
         """
         Move one step in a random direction.
         :return:
         """
-        if self._current_position == self.__target:
+        if np.array_equal(self._current_position, self.__target):
             return self._current_position
         else:
             return super().step()
+
+    def _step_displacements(self, steps: int) -> np.ndarray:
+        """
+        Draw all the grid moves of a walk at once, zeroed out from the first
+        step that lands on the target; the moves are independent, so freezing
+        the pre-drawn path there matches stepping one move at a time.
+        :param steps: Number of steps.
+        :return: The displacements, one step per row.
+        """
+        displacements = super()._step_displacements(steps)
+        if np.array_equal(self._current_position, self.__target):
+            displacements[:] = 0
+            return displacements
+        positions = np.asarray(self._current_position) + np.cumsum(displacements, axis=0)
+        hits = np.where((positions == self.__target).all(axis=1))[0]
+        if hits.size:
+            displacements[hits[0] + 1:] = 0
+        return displacements
+
+    def _walk_batched_restarts(self, steps: int) -> bool:
+        """
+        A restart un-freezes a searcher that already reached its target, so
+        the pre-truncated batch cannot be rebased; walk step by step.
+        :param steps: Number of steps to walk.
+        :return: False.
+        """
+        return False
+
+    def walk_many(self, times: int, steps: int) -> Optional[np.ndarray]:
+        """
+        Searchers freeze at the target mid-walk, so independent runs cannot
+        share one flat draw; each run must truncate its own batch.
+        :param times: Number of walks.
+        :param steps: Number of steps per walk.
+        :return: None.
+        """
+        if times <= 0 or steps <= 0:
+            raise ValueError("Number of steps must be positive.")
+        return None